@@ -1,45 +1,64 @@
+import functools
 import math
 from math import log2, pi
 
 #################################################################
 #################################################################
 
+# `BITREV8[b]` is the byte `b` with its bits reversed
+BITREV8 = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+
+@functools.lru_cache(maxsize=None)
+def _compile_bit_reversal(num_bits: int, as_hex: bool):
+    # builds `x -> reverse_bits(x, num_bits)` (or its hex string) for a fixed width: write `x` out as
+    # little-endian bytes, reverse the bits of each byte with one `translate` through `BITREV8`, and read
+    # the result back big-endian -- all C-level calls. Widths that are not a whole number of bytes are
+    # padded at the top, which lands in the low bits of the result and is shifted out
+    num_bytes = max((num_bits+7) // 8, 1)
+    mask, pad = (1 << num_bits) - 1, 8*num_bytes - num_bits
+    def f(x: int) -> int:
+        return int.from_bytes((x & mask).to_bytes(num_bytes, 'little').translate(BITREV8), 'big') >> pad
+    if as_hex:
+        return lambda x: hex(f(x))
+    return f
+
 def reverse_bits(x: int, num_bits: int) -> int:
-    y = 0
-    for i in range(num_bits):
-        b = (x>>i) & 1
-        y |= (b << (num_bits-i-1))
-    return y
+    # only the low `num_bits` bits of `x` are reversed -- any higher bits are dropped
+    return _compile_bit_reversal(num_bits, False)(x)
 
 # note that fixed point angles here are stored such that the LSB corresponds to pi/2
 # this is the opposite of the convention used in C++
 # we do this because it makes it easier to create the string representation of the angle 
 # and read it from the file (see `expression.cpp`)
 def create_fpa_string(x: int, num_bits: int) -> str:
-    return hex(reverse_bits(x, num_bits))
+    return _compile_bit_reversal(num_bits, True)(x)
+
+# returns `create_fpa_string` specialized to `num_bits`, for hot loops with a fixed width
+def make_fpa_string_fn(num_bits: int):
+    return _compile_bit_reversal(num_bits, True)
 
 #################################################################
 #################################################################
 
+# cached: the same register's (I)QFT is emitted many times, e.g. twice per modular adder in Shor's algorithm
+@functools.lru_cache(maxsize=None)
 def _qft_impl(qr: str, inv: bool, num_bits: int, max_denom: int) -> str:
+    # `angle_strings[d-1]` is the rotation pi/2^d applied between qubits that are `d` apart. As a fixed point
+    # angle that is the single bit `1 << (num_bits-d-1)`, and reversing a single bit just mirrors its position,
+    # so the stored (reversed) value is `1 << d` and no reversal is needed
+    prefix = f'fpa{2*num_bits}'
+    angle_strings = [prefix + hex(1 << d) for d in range(1, min(max_denom, num_bits-1)+1)]
     steps = []
-    # initialize `rot` to pi/2 + pi/4 + ... etc.
-    for i in range(num_bits):
-        steps.append(f'h {qr}[{i}];\n')
-        denom = 1
-        for j in range(i+1, num_bits):
-            if denom > max_denom:
-                break
-            rot = 1 << (num_bits-denom-1)
-            angle_string = create_fpa_string(rot, num_bits)
-            angle_string = f'fpa{2*num_bits}{angle_string}' 
-            steps.append(f'cp({angle_string}) {qr}[{j}], {qr}[{i}];\n')
-            denom += 1
-
-    if inv:
-        steps.reverse()
-    final_string = ''.join(steps)
-    return final_string
+    # the inverse is the forward circuit in reverse order, so walk both loops backwards
+    for i in (reversed(range(num_bits)) if inv else range(num_bits)):
+        targets = range(i+1, min(i+1+max_denom, num_bits))
+        if inv:
+            steps.extend(f'cp({angle_strings[j-i-1]}) {qr}[{j}], {qr}[{i}];\n' for j in reversed(targets))
+            steps.append(f'h {qr}[{i}];\n')
+        else:
+            steps.append(f'h {qr}[{i}];\n')
+            steps.extend(f'cp({angle_strings[j-i-1]}) {qr}[{j}], {qr}[{i}];\n' for j in targets)
+    return ''.join(steps)
 
 def qft(qr: str, num_bits: int, max_denom: int) -> str:
     return _qft_impl(qr, False, num_bits, max_denom)
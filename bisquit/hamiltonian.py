@@ -3,45 +3,107 @@
     date:   01 October 2025
 '''
 
-from hamlib_snippets import *
+from hamlib_snippets import read_pauli_strings_hdf5_bulk
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, pairwise
+
+import numpy as np
 
 #################################################################
 #################################################################
 
 TROTTER_TIME_DIVISION = 5
 TERM_LIMIT = 1_000_000
+# number of expanded terms buffered before each write to the output file
+WRITE_BATCH_SIZE = 4096
+
+# gate that rotates each Pauli operator into the Z basis (Z needs none), and its inverse
+BASIS_CHANGE_GATE = {'X': 'h', 'Y': 'sxdg'}
+BASIS_UNDO_GATE = {'X': 'h', 'Y': 'sx'}
+# drop the basis changes and CXs that cancel between consecutive terms (see `cancelled_gates`)
+CANCEL_ADJACENT_LADDERS = True
+# (basis change qubits, CX ladder controls) to leave out of one side of a term, as bitmasks over the qubits
+NO_CANCELLATION = (0, 0)
 
 #################################################################
 #################################################################
 
-def trotter_expand_pauli_string(ctrl: str, qr: str, term: list[(str, int)], c: float, time_division: int) -> str:
-    out = ''
-    t = term
-    if len(t) == 0:
+@functools.lru_cache(maxsize=None)
+def qubit_fragments(qr: str, num_qubits: int):
+    # pre-formatted QASM pieces for every qubit of `qr`, so expanding a term only looks strings up:
+    #   operands[q]         = `qr[q]`
+    #   basis_change[p & 3][q]  = the basis change for Pauli `p` (as its ASCII code) on `qr[q]`
+    #   basis_undo[p & 3][q]    = its inverse
+    #   cx_ladder[lq][q]        = `cx qr[q], qr[lq]` (each row is built the first time `lq` is a target)
+    # the low two bits of 'X', 'Y', 'Z' are 0, 1, 2, so the basis tables are indexed without branching;
+    # the rows for Z (and the unused slot 3) are empty strings
+    operands = [f'{qr}[{q}]' for q in range(num_qubits)]
+    def basis_table(gates):
+        table = [[''] * num_qubits for _ in range(4)]
+        for (p,g) in gates.items():
+            table[ord(p) & 3] = [f'{g} {o};\n' for o in operands]
+        return table
+    return operands, basis_table(BASIS_CHANGE_GATE), basis_table(BASIS_UNDO_GATE), {}
+
+def cancelled_gates(a: tuple[bytes, list[int]], b: tuple[bytes, list[int]]):
+    # gates that cancel when term `b = (ops, qubits)` directly follows term `a`. Between the two RZs, the circuit is
+    #   (a's ladder)^-1 (a's basis change)^-1 (b's basis change) (b's ladder)
+    # so the basis changes cancel on every qubit where both terms apply the same Pauli. If both ladders also target
+    # the same qubit with the same Pauli, the CXs from controls shared this way cancel too (CXs with a common target
+    # commute). Returns the qubits whose basis changes and the controls whose CXs are dropped from both sides, as
+    # bitmasks (bit `q` set for qubit `q`).
+    (a_ops, a_qubits), (b_ops, b_qubits) = a, b
+    if len(a_qubits) == 0 or len(b_qubits) == 0:
+        return NO_CANCELLATION
+    a_support, b_support = pauli_supports(a_ops, a_qubits), pauli_supports(b_ops, b_qubits)
+    same = (a_support[0] & b_support[0]) | (a_support[1] & b_support[1]) | (a_support[2] & b_support[2])
+    lq = b_qubits[-1]
+    if a_qubits[-1] != lq or not (same >> lq) & 1:
+        return (same, 0)
+    return (same, same & ~(1 << lq))
+
+def pauli_supports(ops: bytes, qubits: list[int]):
+    # bitmasks of the qubits each Pauli acts on, indexed like the basis tables (`ord(p) & 3`: X, Y, Z)
+    support = [0, 0, 0, 0]
+    for (p,q) in zip(ops, qubits):
+        support[p & 3] |= 1 << q
+    return support
+
+def trotter_expand_pauli_string(ctrl: str, qr: str, ops: bytes, qubits: list[int], c: float | str, time_division: int, num_qubits: int,
+                                    cancel_in=NO_CANCELLATION, cancel_out=NO_CANCELLATION) -> str:
+    # the term is given as parallel sequences: `ops[i]` is the Pauli letter acting on `qubits[i]`
+    # `cancel_in`/`cancel_out` are the gates shared with the previous/next term (see `cancelled_gates`)
+    # `c` may also be passed already formatted (as `repr(c)`)
+    if len(qubits) == 0:
         return ''
-    
+    operands, basis_change, basis_undo, cx_ladder = qubit_fragments(qr, num_qubits)
+    (basis_in, cx_in), (basis_out, cx_out) = cancel_in, cancel_out
+    lq = qubits[-1]
+    cx = cx_ladder.get(lq)
+    if cx is None:
+        cx = cx_ladder[lq] = [f'cx {o}, {operands[lq]};\n' for o in operands]
+
     # do basis transformations:
-    for (p,q) in t:
-        if p == 'X':
-            out += f'h {qr}[{q}];\n'
-        elif p == 'Y':
-            out += f'sxdg {qr}[{q}];\n'
+    parts = [basis_change[p & 3][q] for (p,q) in zip(ops, qubits) if not (basis_in >> q) & 1]
     # now do two qubit ladder -- do from all qubits to final qubit (can be implemented with one multi-target CX)
-    _, lq = t[-1]
-    for (_,q) in t[:-1]:
-        out += f'cx {qr}[{q}], {qr}[{lq}];\n'
+    # the uncompute ladder is the same strings in reverse, so look them up once
+    ladder = [cx[q] for q in islice(qubits, len(qubits)-1)]
+    if cx_in:
+        parts.extend(g for (q,g) in zip(qubits, ladder) if not (cx_in >> q) & 1)
+    else:
+        parts.extend(ladder)
     # do RZ from control to final qubit here: 
-    out += f'crz({c}) {ctrl}, {qr}[{lq}];\n'
-    _, lq = t[-1]
-    for (_,q) in t[:-1][::-1]:
-        out += f'cx {qr}[{q}], {qr}[{lq}];\n'
+    parts.append('crz(' + (c if isinstance(c, str) else repr(c)) + ') ' + ctrl + ', ' + operands[lq] + ';\n')
+    if cx_out:
+        parts.extend(ladder[k] for k in reversed(range(len(ladder))) if not (cx_out >> qubits[k]) & 1)
+    else:
+        parts.extend(reversed(ladder))
     # undo any basis transformations:
-    for (p,q) in t:
-        if p == 'X':
-            out += f'h {qr}[{q}];\n'
-        elif p == 'Y':
-            out += f'sxdg {qr}[{q}];\n'
-    return out
+    parts.extend(basis_undo[p & 3][q] for (p,q) in zip(ops, qubits) if not (basis_out >> q) & 1)
+    return ''.join(parts)
 
 #################################################################
 #################################################################
@@ -52,51 +114,62 @@ BENCHMARK_LIST = [
     ('e_cr2_120', 'Cr2.hdf5', '/ham_BK120', 120),
 ]
     
-if __name__ == '__main__':
-    for (output_file_name, input_file, key, num_qubits) in BENCHMARK_LIST:
-        term_count = count_terms_hdf5(f'bisquit/hamlib/{input_file}', key)
-        output_path = f'bisquit/qasm/{output_file_name}_trotter.qasm'
-        print(output_path)
-
-        with open(output_path, 'w') as f:
-            f.write(f'OPENQASM 2.0;\n')
-            f.write(f'include "qelib1.inc";\n')
-            f.write(f'qreg q[{num_qubits}];\n')
-            f.write(f'qreg ctrl;\n')
-
-            f.write('h ctrl;\n')
-
-            # compute normalization constant:
-            n = 0
-            approx_lambda_max = 0.0
-            threshold = 0.0
-            for (labels, coeff, _) in read_pauli_strings_hdf5(f'bisquit/hamlib/{input_file}', key):
-                approx_lambda_max += abs(coeff)
-                threshold += abs(coeff)
-                n += 1
-
-            # implement ipea:
-            threshold = threshold / n
-            print(f'reading {input_file}/{key}, threshold = {threshold}')
-            i = 0
-            for (labels, coeff, _) in read_pauli_strings_hdf5(f'bisquit/hamlib/{input_file}', key):
-                if abs(coeff) < threshold:
-                    continue
-
-                if i % 100_000 == 0:
-                    print(f'\twriting term {i}')
-                if i >= TERM_LIMIT:
-                    break
-
-                coeff *= 1/(2*approx_lambda_max)
-                
-                i += 1
-                trotter_pauli_expansion = trotter_expand_pauli_string('ctrl', 'q', labels, coeff, TROTTER_TIME_DIVISION)
-                if len(trotter_pauli_expansion) > 0:
-                    f.write(trotter_pauli_expansion)
-
-            f.write('h ctrl;\n')
+def generate_benchmark(benchmark: tuple[str, str, str, int]):
+    (output_file_name, input_file, key, num_qubits) = benchmark
+    output_path = f'bisquit/qasm/{output_file_name}_trotter.qasm'
+    print(output_path)
+
+    with open(output_path, 'w', buffering=1<<20) as f:
+        f.write(f'OPENQASM 2.0;\n')
+        f.write(f'include "qelib1.inc";\n')
+        f.write(f'qreg q[{num_qubits}];\n')
+        f.write(f'qreg ctrl;\n')
+
+        f.write('h ctrl;\n')
+
+        # compute normalization constant and threshold over all coefficients at once:
+        coeffs, term_label = read_pauli_strings_hdf5_bulk(f'bisquit/hamlib/{input_file}', key)
+        abs_coeffs = np.abs(coeffs)
+        approx_lambda_max = float(abs_coeffs.sum())
+        threshold = float(abs_coeffs.mean())
+
+        # implement ipea:
+        print(f'reading {input_file}/{key}, threshold = {threshold}')
+        kept = np.flatnonzero(abs_coeffs >= threshold)
+        progress_at = set(range(0, TERM_LIMIT, 100_000))
+        batch = []
+        # pair each term with its successor (None after the last) to find the gates they share
+        terms = (term_label(k) for k in islice(kept.tolist(), TERM_LIMIT))
+        cancel_in = NO_CANCELLATION
+        scaled_coeffs = coeffs[kept] * (1/(2*approx_lambda_max))
+        # format each distinct angle once -- Hamiltonians repeat coefficients heavily
+        unique_coeffs, coeff_index = np.unique(scaled_coeffs, return_inverse=True)
+        unique_angles = [repr(c) for c in unique_coeffs.tolist()]
+        angles = (unique_angles[j] for j in coeff_index.tolist())
+        for (i, (angle, (term, next_term))) in enumerate(zip(angles, pairwise(chain(terms, [None])))):
+            if i in progress_at:
+                print(f'\twriting term {i}')
+
+            if CANCEL_ADJACENT_LADDERS and next_term is not None:
+                cancel_out = cancelled_gates(term, next_term)
+            else:
+                cancel_out = NO_CANCELLATION
+            (ops, qubits) = term
+            batch.append(trotter_expand_pauli_string('ctrl', 'q', ops, qubits, angle, TROTTER_TIME_DIVISION, num_qubits,
+                                                        cancel_in, cancel_out))
+            cancel_in = cancel_out
+            if len(batch) >= WRITE_BATCH_SIZE:
+                f.writelines(batch)
+                batch.clear()
+        f.writelines(batch)
+
+        f.write('h ctrl;\n')
 
 
+if __name__ == '__main__':
+    # benchmarks are independent, so generate each one in its own process
+    with ProcessPoolExecutor(max_workers=min(len(BENCHMARK_LIST), os.cpu_count() or 1)) as executor:
+        list(executor.map(generate_benchmark, BENCHMARK_LIST))
+
 #################################################################
 #################################################################
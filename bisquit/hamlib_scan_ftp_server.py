@@ -14,9 +14,9 @@
 
 import argparse
 import csv
-import io
 import sys
 
+import numpy as np
 import requests
 
 ############################################################
@@ -26,6 +26,9 @@ HAMLIB_BASE_URL    = "https://portal.nersc.gov/cfs/m888/dcamps/hamlib"
 DEFAULT_MIN_QUBITS = 50
 DEFAULT_MIN_TERMS  = 0
 
+# Shared so repeated fetches reuse the (keep-alive) connection to the portal.
+_SESSION = requests.Session()
+
 ############################################################
 ############################################################
 
@@ -43,26 +46,42 @@ def _csv_url_from_subdir(subdir: str) -> str:
 def _fetch_csv(url: str) -> list[dict]:
     """
     Downloads and parses the CSV at `url`. Returns a list of row dicts.
-    Raises on HTTP errors.
+    Raises on HTTP errors. Rows are parsed as the (gzip-encoded) response
+    streams in, without first buffering the whole body as text.
+    """
+    with _SESSION.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        reader = csv.DictReader(line.decode("utf-8") for line in response.iter_lines())
+        return list(reader)
+
+
+def _int_column(rows: list[dict], name: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts column `name` to an int64 array in one vectorized pass (an array of Python
+    ints if some value is too long for int64). Returns the values along with a mask of
+    the entries that were valid non-negative integers.
     """
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    reader = csv.DictReader(io.StringIO(response.text))
-    return list(reader)
+    col = np.char.strip(np.array([row.get(name) or "" for row in rows], dtype=str))
+    # isdecimal, not isdigit: digits such as '²' pass isdigit but are rejected by the int conversion
+    valid = np.char.isdecimal(col)
+    # int64 holds every 18-digit integer. Longer ones may not fit, so then fall back to Python ints
+    # (an object array, which still compares elementwise) rather than overflow
+    if np.any(np.char.str_len(col[valid]) > 18):
+        return np.array([int(v) if ok else 0 for (v, ok) in zip(col, valid)], dtype=object), valid
+    values = np.zeros(len(rows), dtype=np.int64)
+    values[valid] = col[valid].astype(np.int64)
+    return values, valid
 
 
 def _filter_hamiltonians(rows: list[dict], min_qubits: int, min_terms: int) -> list[dict]:
     """
     Returns rows where 'nqubits' > min_qubits AND 'terms' > min_terms.
+    Rows with a missing or non-integer count are skipped.
     """
-    result = []
-    for row in rows:
-        try:
-            if int(row["nqubits"]) > min_qubits and int(row["terms"]) > min_terms:
-                result.append(row)
-        except (ValueError, KeyError):
-            pass
-    return result
+    nqubits, nqubits_valid = _int_column(rows, "nqubits")
+    terms, terms_valid     = _int_column(rows, "terms")
+    keep = nqubits_valid & terms_valid & (nqubits > min_qubits) & (terms > min_terms)
+    return [rows[i] for i in np.flatnonzero(keep)]
 
 
 def _print_results(rows: list[dict], subdir: str, min_qubits: int, min_terms: int) -> None:
@@ -2,9 +2,13 @@ import numpy as np
 import h5py
 import re
 
+from array import array
+
 #################################################################
 #################################################################
 
+# h5py.File is a subclass of h5py.Group, listed for clarity
+_HDF5_GROUP_TYPES = (h5py.Group, h5py.File)
 
 def parse_through_hdf5(func):
     """
@@ -14,11 +18,11 @@ def parse_through_hdf5(func):
     """
 
     def wrapper(obj, path='/', key=None):
-        if type(obj) in [h5py._hl.group.Group, h5py._hl.files.File]:
+        if isinstance(obj, _HDF5_GROUP_TYPES):
             for ky in obj.keys():
                 func(obj, path, key=ky, leaf=False)
                 wrapper(obj=obj[ky], path=path + ky + '/', key=ky)
-        elif type(obj) is h5py._hl.dataset.Dataset:
+        elif isinstance(obj, h5py.Dataset):
             func(obj, path, key=None, leaf=True)
     return wrapper
 
@@ -68,105 +72,65 @@ def get_hdf5_keys(fname_hdf5: str):
 #################################################################
 #################################################################
 
+# A term is `(coeff) [P0 P1 ...]`; the coefficient may also be written without parentheses.
+_TERM_RE = re.compile(r'(\([^)]*\)|[^\s\[\]()]+)\s*\[([^\]]*)\]')
+_OP_RE = re.compile(r'([XYZ])(\d+)')
+_TERM_RE_BYTES = re.compile(_TERM_RE.pattern.encode())
+_OP_NAME_RE_BYTES = re.compile(rb'([XYZ])\d+')
+_OP_QUBIT_RE_BYTES = re.compile(rb'[XYZ](\d+)')
+
+def parse_coeff(coeff_str: str) -> float:
+    """
+    Parse a term's coefficient to a float (its real part). HamLib writes
+    coefficients as `(<real>+0j)` or `(<real>-0j)`, which are sliced and passed to
+    float() directly; anything else falls back to complex(). Raises ValueError
+    if the coefficient is not a number.
+    """
+    if coeff_str.endswith('0j)') and coeff_str[-4:-3] in ('+', '-'):
+        try:
+            return float(coeff_str[1:-4])
+        except ValueError:
+            pass
+    return complex(coeff_str).real
+
+def parse_pauli_label(pstring: str):
+    """
+    Parse the inside of a term's brackets (e.g. 'X0 Y3') into a list of
+    (operator, qubit) pairs.
+    """
+    return [(p, int(q)) for (p, q) in _OP_RE.findall(pstring)]
+
 def read_pauli_string_text(text: str):
     """
-    Split the text by '+' between each term and parse the Pauli strings.
+    Scan the text for '+'-separated terms and parse the Pauli strings.
     
     Args:
-        text (str): The text containing Pauli string terms separated by '+'
+        text (str or bytes): The text containing Pauli string terms separated by '+'.
+            When given bytes, only the matched coefficient and Pauli string of each
+            term are decoded.
         
-    Returns:
-        tuple: (labels, coeffs) where labels is a list of Pauli string labels
-               and coeffs is a list of corresponding coefficients
+    Yields:
+        tuple: (label, coeff, max_qubit) where label is a list of (operator, qubit)
+               pairs (empty for the identity operator), coeff is the real part of
+               the coefficient, and max_qubit is the largest qubit index in label
     """
-    import re
-    
-    labels = []
-    coeffs = []
-
-    # Use regex to split on '+' that are not inside parentheses
-    # This pattern matches '+' that are followed by whitespace and not inside parentheses
-    pattern = r'\+\s*(?![^()]*\))'
-    terms = re.split(pattern, text)
-    
-    for (i,term) in enumerate(terms):
-        max_qubit = 0
+    is_bytes = isinstance(text, bytes)
+    for (i, m) in enumerate((_TERM_RE_BYTES if is_bytes else _TERM_RE).finditer(text)):
         if i % 1_000_000 == 0:
-            print(f'\tprocessing term {i} of {len(terms)}')
-        term = term.strip()
-        if not term:  # Skip empty terms
-            continue
-            
-        # Split coefficient and Pauli string
-        parts = term.split()
-        if len(parts) < 2:
-            continue
-            
-        # Extract coefficient (remove parentheses and convert to float)
-        coeff_str = parts[0]
-        if coeff_str.startswith('(') and coeff_str.endswith('j)'):
-            # Handle complex numbers like (-1761.1833868195836+0j)
-            coeff_str = coeff_str[1:-2]  # Remove ( and j)
-            if '+' in coeff_str:
-                coeff_str = coeff_str.split('+')[0]  # Take real part
-            elif '-' in coeff_str and coeff_str[0] != '-':
-                coeff_str = coeff_str.split('-')[0]  # Take real part
-        elif coeff_str.startswith('(') and coeff_str.endswith(')'):
-            coeff_str = coeff_str[1:-1]  # Remove parentheses
-            
+            print(f'\tprocessing term {i}')
+        coeff_str, pstring = m.group(1, 2)
         try:
-            coeff = float(coeff_str)
+            if is_bytes:
+                coeff_str, pstring = coeff_str.decode('ascii'), pstring.decode('ascii')
+            coeff = parse_coeff(coeff_str)
         except ValueError:
             continue
-            
-        # Extract Pauli string from brackets
-        pauli_str = ' '.join(parts[1:])  # Join remaining parts
-        lbracket_idx = pauli_str.find('[')
-        rbracket_idx = pauli_str.find(']')
-        
-        if lbracket_idx != -1 and rbracket_idx != -1:
-            pstring = pauli_str[lbracket_idx+1:rbracket_idx]
-            # Parse Pauli string into list of (operator, qubit) tuples
-            # Empty Pauli string represents identity operator
-            pauli_parts = pstring.split()
-            label = []
-            for part in pauli_parts:
-                if len(part) >= 2:
-                    operator = part[0]  # X, Y, or Z
-                    qubit = int(part[1:])  # qubit index
-                    label.append((operator, qubit))
-                    max_qubit = max(max_qubit, qubit)
-            
-        # Add the term (empty label represents identity operator)
-        yield (label, coeff, max_qubit)
+        label = parse_pauli_label(pstring)
+        yield (label, coeff, max((q for (_, q) in label), default=0))
 
 #################################################################
 #################################################################
 
-
-def split_text_by_plus(text: str):
-    """
-    Simple function to split text by '+' between each term.
-    Handles complex numbers properly by not splitting on '+' within parentheses.
-    
-    Args:
-        text (str): The text to split
-        
-    Returns:
-        list: List of terms split by '+'
-    """
-    import re
-    
-    # Use regex to split on '+' that are not inside parentheses
-    # This pattern matches '+' that are followed by whitespace and not inside parentheses
-    pattern = r'\+\s*(?![^()]*\))'
-    terms = re.split(pattern, text)
-    
-    # Clean up whitespace and filter out empty terms
-    cleaned_terms = [term.strip() for term in terms if term.strip()]
-    return cleaned_terms
-
-
 def test_text_splitting():
     """
     Test function to demonstrate text splitting functionality.
@@ -183,18 +147,9 @@ def test_text_splitting():
     print(sample_text)
     print("\n" + "="*50 + "\n")
     
-    # Test simple splitting
-    print("Simple splitting by '+':")
-    terms = split_text_by_plus(sample_text)
-    for i, term in enumerate(terms):
-        print(f"Term {i+1}: {term}")
-    
-    print("\n" + "="*50 + "\n")
-    
     # Test Pauli string parsing
     print("Pauli string parsing:")
-    labels, coeffs = read_pauli_string_text(sample_text)
-    for i, (label, coeff) in enumerate(zip(labels, coeffs)):
+    for i, (label, coeff, _) in enumerate(read_pauli_string_text(sample_text)):
         if label:
             print(f"Term {i+1}: coeff={coeff}, pauli_string={label}")
         else:
@@ -203,25 +158,53 @@ def test_text_splitting():
 #################################################################
 #################################################################
 
+def read_hdf5_bytes(fname_hdf5: str, key: str) -> bytes:
+    """
+    Read the raw (undecoded) operator text stored at the specified key with a
+    single dataset read. The file is closed before the data is returned.
+    """
+    with h5py.File(fname_hdf5, 'r', libver='latest') as f:
+        return f[key][()]
+
 def read_pauli_strings_hdf5(fname_hdf5: str, key: str):
     """
     Read the operator object from HDF5 at specified key to qiskit SparsePauliOp
     format.
     """
+    yield from read_pauli_string_text(read_hdf5_bytes(fname_hdf5, key))
 
-    with h5py.File(fname_hdf5, 'r', libver='latest') as f:
-        for label, coeff, max_qubit in read_pauli_string_text(f[key][()].decode("utf-8")):
-            yield (label, coeff, max_qubit)
+def read_pauli_strings_hdf5_bulk(fname_hdf5: str, key: str):
+    """
+    Read the coefficients of all terms at the specified key in one pass without
+    parsing their Pauli strings. Returns a NumPy array of the coefficients and a
+    function that parses the label of the i-th term on demand, so that labels
+    are only built for the terms that are used.
+
+    Labels are returned as parallel sequences rather than (operator, qubit) pairs:
+    a bytes object of operator letters (e.g. b'XZY') and a list of qubit indices.
+    """
+    data = read_hdf5_bytes(fname_hdf5, key)
+    coeffs = array('d')
+    spans = array('q')
+    for m in _TERM_RE_BYTES.finditer(data):
+        try:
+            coeff = parse_coeff(m.group(1).decode('ascii'))
+        except ValueError:
+            continue
+        coeffs.append(coeff)
+        spans.extend(m.span(2))
+
+    def label(i: int):
+        pstring = data[spans[2*i]:spans[2*i+1]]
+        return (b''.join(_OP_NAME_RE_BYTES.findall(pstring)),
+                list(map(int, _OP_QUBIT_RE_BYTES.findall(pstring))))
+    return np.frombuffer(coeffs, dtype=np.float64), label
 
 def count_terms_hdf5(fname_hdf5: str, key: str):
     """
     Count the number of terms in the HDF5 file at specified key.
     """
-    with h5py.File(fname_hdf5, 'r', libver='latest') as f:
-        text = f[key][()].decode("utf-8")
-        pattern = r'\+\s*(?![^()]*\))'
-        terms = re.split(pattern, text)
-        return len(terms)
+    return sum(1 for _ in _TERM_RE_BYTES.finditer(read_hdf5_bytes(fname_hdf5, key)))
 
 #################################################################
 #################################################################
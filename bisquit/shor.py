@@ -5,8 +5,12 @@
     Creates a qasm file for BISQUIT's shor benchmark.
 '''
 
+import functools
+import os
 import random
-import multiprocessing as mp
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 from common import *
 
@@ -45,97 +49,143 @@ if RSA_MODE == 16:
 
 NUM_BITS = RSA_MODE
 QFT_DENOM = calculate_aqft_max_denom(NUM_BITS)
+# fixed point angles are written as `fpa<bits><hex value>`
+FPA_PREFIX = f'fpa{2*NUM_BITS}'
 
 #################################################################
 #################################################################
 
-QFT_CACHE = {} # maps qft for given register to qasm string
-IQFT_CACHE = {}
+# only the adders by `N` recur (in every `mod_adder`). Adders by any other `a` are not cached: `cmul` doubles `a`
+# for each `mod_adder`, so they never repeat
+FADD_CACHE = {} # maps (ctrl, qr, inv) to the qasm string of the fourier adder by `N`
+
+@functools.lru_cache(maxsize=None)
+def fourier_adder_lines(ctrl: tuple[str, ...], qr: str) -> tuple[str, list[str]]:
+    # the parts of `fourier_adder`'s gates that do not depend on `a`, specialized to the controls and register:
+    # the gate name (chosen by the number of controls), and the end of the line after the angle for each qubit of `qr`.
+    # The same controls are used by several adders (e.g., `ccfadd_a` and its inverse in `mod_adder`)
+    if len(ctrl) == 0:
+        gate, operands = 'p(', ') '
+    elif len(ctrl) == 1:
+        gate, operands = 'cp(', f') {ctrl[0]}, '
+    else:
+        gate, operands = 'ccp(', f') {ctrl[0]}, {ctrl[1]}, '
+    return gate, [f'{operands}{qr}[{i}];\n' for i in range(NUM_BITS)]
 
 def fourier_adder(ctrl: list[str], qr: str, a: int, inv=False) -> str:
     '''
         Performs |qr> --> |a + qr>
     '''
-    out_array = []
-    for i in range(NUM_BITS):
+    key = (tuple(ctrl), qr, inv)
+    if a == N and key in FADD_CACHE:
+        return FADD_CACHE[key]
+    # masking the top `i` bits of `a` is clearing the low `i` bits of its reversal, so reverse `a` once.
+    # Bits of `a` above `NUM_BITS` are not part of the angle, but still make it nonzero (`cmul` shifts `a` past them)
+    rev_a = reverse_bits(a, NUM_BITS)   # the LSB of `a` corresponds to `pi` (we want MSB to correspond to `pi`)
+    has_high_bits = (a >> NUM_BITS) != 0
+    # the angle only changes when the bit being cleared is set, so reformat it only then. The bits of `rev_a` are
+    # read once (LSB first) instead of shifting `rot` on every step, and `rot` reaches zero at its bit length
+    rev_bits = format(rev_a, f'0{NUM_BITS}b')[::-1]
+    num_steps = NUM_BITS if has_high_bits else rev_a.bit_length()
+    (gate, line_ends) = fourier_adder_lines(tuple(ctrl), qr)
+    rot = rev_a
+    angle_string = FPA_PREFIX + hex(rot)
+    angle_strings = []
+    for i in range(num_steps):
 #        rot_angle = [ f'pi/{j}' for j in range(NUM_BITS-1) if bit_is_set(a,j) ]
 #        angle_string = ' + '.join(rot_angle)
 
-        # need to mask top `i` bits of `a`
-        rot_mask = ((1<<i)-1) << (NUM_BITS-i)
-        rot = a & ~rot_mask
-        if rot == 0:
-            continue
-        angle_string = create_fpa_string(rot, NUM_BITS)
-        angle_string = f'fpa{2*NUM_BITS}{angle_string}'   # note that we need to reverse the string because the LSB of `a` corresponds to `pi` (we want MSB to correspond to `pi`)
-
-        if len(ctrl) == 0:
-            out_array.append(f'p({angle_string}) {qr}[{i}];')
-        elif len(ctrl) == 1:
-            out_array.append(f'cp({angle_string}) {ctrl[0]}, {qr}[{i}];')
-        else:
-            out_array.append(f'ccp({angle_string}) {ctrl[0]}, {ctrl[1]}, {qr}[{i}];')
-    if inv:
-        out_array.reverse()
-    out = '\n'.join(out_array)
+        # need to mask top `i` bits of `a` (the low `i` bits of `rot`)
+        if i > 0 and rev_bits[i-1] == '1':
+            rot ^= 1 << (i-1)
+            angle_string = FPA_PREFIX + hex(rot)
+        angle_strings.append(angle_string)
+    # then format every gate with one template
+    steps = reversed(range(num_steps)) if inv else range(num_steps)
+    out_array = [gate + angle_strings[i] + line_ends[i] for i in steps]
+    out = ''.join(out_array)
+    if a == N:
+        FADD_CACHE[key] = out
     return out
 
 def mod_adder(c1: str, c2: str, qr: str, anc: str, a: int) -> str:
     '''
         Performs |qr> --> |(a+qr) mod N>
     '''
-    out = ''
-
     ccfadd_a = fourier_adder([c1, c2], qr, a)
     ccfadd_a_inv = fourier_adder([c1, c2], qr, a, inv=True)
-
-    if qr not in QFT_CACHE:
-        QFT_CACHE[qr] = qft(qr, NUM_BITS, QFT_DENOM)
-    if qr not in IQFT_CACHE:
-        IQFT_CACHE[qr] = iqft(qr, NUM_BITS, QFT_DENOM)
-
-    iqft_qr = IQFT_CACHE[qr]
-    qft_qr = QFT_CACHE[qr]
-
-    out += ccfadd_a
-    out += fourier_adder([], qr, N, inv=True)
-    out += iqft_qr
-    out += f'cx {qr}[{NUM_BITS-1}], {anc};\n'
-    out += qft_qr
-    out += fourier_adder([anc], qr, N)
-    out += ccfadd_a_inv
-    out += iqft_qr
-    out += f'x {qr}[{NUM_BITS-1}];\ncx {qr}[{NUM_BITS-1}], {anc};\nx {qr}[{NUM_BITS-1}];\n'
-    out += qft_qr
-    out += ccfadd_a
-
-    return out
+    # `qft`/`iqft` are cached per register (see `_qft_impl`)
+    iqft_qr = iqft(qr, NUM_BITS, QFT_DENOM)
+    qft_qr = qft(qr, NUM_BITS, QFT_DENOM)
+
+    parts = [
+        ccfadd_a,
+        fourier_adder([], qr, N, inv=True),
+        iqft_qr,
+        f'cx {qr}[{NUM_BITS-1}], {anc};\n',
+        qft_qr,
+        fourier_adder([anc], qr, N),
+        ccfadd_a_inv,
+        iqft_qr,
+        f'x {qr}[{NUM_BITS-1}];\ncx {qr}[{NUM_BITS-1}], {anc};\nx {qr}[{NUM_BITS-1}];\n',
+        qft_qr,
+        ccfadd_a
+    ]
+    return ''.join(parts)
 
 def cmul(c: str, qx: str, qr: str, anc: str, a: int) -> str:
     print(f'\t\t\tcmul {c}, {qx}, {qr}, {anc}, {a}')
 
-    out = ''
-    out += qft(qr, NUM_BITS, QFT_DENOM)
+    parts = [qft(qr, NUM_BITS, QFT_DENOM)]
     for i in range(NUM_BITS):
         a <<= 1
-        out += mod_adder(c, f'{qx}[{i}]', qr, anc, a)
-    out += iqft(qr, NUM_BITS, QFT_DENOM)
-    return out
+        parts.append(mod_adder(c, f'{qx}[{i}]', qr, anc, a))
+    parts.append(iqft(qr, NUM_BITS, QFT_DENOM))
+    return ''.join(parts)
 
 def cua(c: str, qx: str, qr: str, anc: str, a: int, a_inv: int) -> str:
     print(f'\tcua {c}, {qx}, {qr}, {anc}, {a}, {a_inv}')
 
-    out = ''
-    out += cmul(c, qx, qr, anc, a)
-    out += f'cswap {c}, {qx}, {qr};\n'
-    out += cmul(c, qx, qr, anc, a_inv)
-    return out
+    return ''.join([
+        cmul(c, qx, qr, anc, a),
+        f'cswap {c}, {qx}, {qr};\n',
+        cmul(c, qx, qr, anc, a_inv)
+    ])
 
 #################################################################
 #################################################################
 
 MAX_ITERATION = 2*NUM_BITS
 ITER_COUNT = 4
+# bytes per read/write (or in-kernel copy) when appending each iteration's file to the output
+COPY_BLOCK_SIZE = 1<<20
+
+def generate_iteration(i: int, a: int, a_inv: int, output_dir: str) -> str:
+    # writes iteration `i` to a file in the (temporary) directory `output_dir` and returns its path, so only the
+    # path (not the multi-megabyte qasm string) is sent back to the main process
+    print('\t', 'writing iteration', i)
+    # qasm is ascii, so encode once here and write bytes -- the main process then copies raw bytes too
+    text = f'// iteration {i}\n\n' + cua('c', 'q', 'anc_blk', 'anc_mod_adder', a, a_inv)
+    path = os.path.join(output_dir, f'iter{i}.qasm')
+    with open(path, 'wb') as ostrm:
+        ostrm.write(text.encode('ascii'))
+    return path
+
+def append_file(path: str, ostrm) -> None:
+    # copies the file at `path` onto the end of the binary stream `ostrm`. Where the OS supports it, the data is
+    # copied in the kernel (`os.copy_file_range`) and never passes through this process
+    with open(path, 'rb') as istrm:
+        if hasattr(os, 'copy_file_range'):
+            ostrm.flush()
+            try:
+                while os.copy_file_range(istrm.fileno(), ostrm.fileno(), COPY_BLOCK_SIZE) > 0:
+                    pass
+                return
+            except OSError:
+                # unsupported by this file system -- nothing was copied unless the first call succeeded
+                if istrm.tell() != 0:
+                    raise
+        shutil.copyfileobj(istrm, ostrm, COPY_BLOCK_SIZE)
 
 if __name__ == '__main__':
     output_file = f'bisquit/qasm/shor_rsa{NUM_BITS}_iter_{ITER_COUNT}.qasm'
@@ -148,35 +198,46 @@ if __name__ == '__main__':
         idx = random.randint(0, iter_inc_freq-1)
         iter_list.append(i+idx)
 
-    a, a_inv = A, A_INV
     rot = random.randint(0, 2**(2*NUM_BITS-1)-1)
 
-    with open(output_file, 'w') as ostrm:
-        ostrm.write(f'OPENQASM 2.0;\n')
-        ostrm.write(f'include "qelib1.inc";\n\n')
-        ostrm.write(f'qreg c;\n')
-        ostrm.write(f'qreg anc_blk[{NUM_BITS}];\n')
-        ostrm.write(f'qreg anc_mod_adder;\n')
-        ostrm.write(f'qreg q[{NUM_BITS}];\n\n')
-
+    # compute the whole `a^(2^i) mod N` schedule (and its inverse) in one pass here, so each worker only
+    # receives the values for its iteration. Iteration `i` uses `a^(2^(i+1))`
+    a_seq, a_inv_seq = [A], [A_INV]
+    for i in range(0, MAX_ITERATION):
+        a_seq.append((a_seq[-1]*a_seq[-1]) % N)
+        a_inv_seq.append((a_inv_seq[-1]*a_inv_seq[-1]) % N)
+    # low `i` bits of rot (rot with its top `2*NUM_BITS-i` bits removed)
+    rot_seq = [rot & ((1<<i)-1) for i in range(0, MAX_ITERATION)]
+#   for i in iter_list:
+#       if rot_seq[i] != 0:
+#           ostrm.write(f'rz(fpa{2*NUM_BITS}{create_fpa_string(rot_seq[i], NUM_BITS)}) c;\n')
+    schedule = [(i, a_seq[i+1], a_inv_seq[i+1]) for i in iter_list]
+
+    # one pool for every iteration: a worker's `fourier_adder` cache (the adders by `N`) carries over between iterations.
+    # The iterations are written to a temporary directory next to the output (so `append_file` stays on one file
+    # system), which is removed -- with any leftover iteration files -- after the pool shuts down, even on failure
+    num_workers = min(len(schedule), os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(output_file)) as iter_dir,\
+            ProcessPoolExecutor(max_workers=num_workers) as executor,\
+            open(output_file, 'wb') as ostrm:
+        futures = [executor.submit(generate_iteration, i, a, a_inv, iter_dir)
+                    for (i, a, a_inv) in schedule]
+
+        header = (f'OPENQASM 2.0;\n'
+                  f'include "qelib1.inc";\n\n'
+                  f'qreg c;\n'
+                  f'qreg anc_blk[{NUM_BITS}];\n'
+                  f'qreg anc_mod_adder;\n'
+                  f'qreg q[{NUM_BITS}];\n\n')
         # initialization:
-        ostrm.write(f'x q;\n') # vector op
-
-        for i in range(0, MAX_ITERATION):
-            print(f'iteration {i}')
-            a = (a*a) % N
-            a_inv = (a_inv*a_inv) % N
-            # remove top `2*NUM_BITS-ii` bits of rot
-            mask = ((1<<(2*NUM_BITS-i))-1) << i
-            _rot = rot & ~mask
-
-            if i in iter_list:
-                print('\t', 'writing iteration', i)
-                ostrm.write(f'// iteration {i}\n\n')
-                iter_text = cua('c', 'q', 'anc_blk', 'anc_mod_adder', a, a_inv)
-                ostrm.write(iter_text)
-#               if _rot != 0:
-#                   ostrm.write(f'rz(fpa{2*NUM_BITS}{create_fpa_string(_rot, NUM_BITS)}) c;\n')
+        header += f'x q;\n' # vector op
+        ostrm.write(header.encode('ascii'))
+
+        # append the iterations in order as they finish
+        for fut in futures:
+            iter_file = fut.result()
+            append_file(iter_file, ostrm)
+            os.remove(iter_file)
     print('qft denom: ', QFT_DENOM) 
 
 #################################################################
@@ -1,23 +1,34 @@
 import os
+import shlex
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 files = [f for f in os.listdir('bisquit/qasm') if f.endswith('.qasm') or f.endswith('.qasm.xz')]
 
 NUM_THREADS = 16
+# number of benchmarks built at once -- `xz` gets an equal share of `NUM_THREADS`
+NUM_JOBS = max(min(4, (os.cpu_count() or 1)//2), 1)
+
+def build_binary(f, tag=None, extra_options=''):
+    f_part = f.split('.')
+    filename = f_part[0]
+    if tag is None:
+        output_file = f'benchmarks/bin/BQ_{filename}'
+        stats_file = f'benchmarks/stats/BQ_{filename}.txt'
+    else:
+        output_file = f'benchmarks/bin/BQ_{filename}.{tag}'
+        stats_file = f'benchmarks/stats/BQ_{filename}.{tag}.txt'
+
+    # run the commands directly (no shell) -- `check=True` stops before compressing a failed build
+    cmd = ['./build/qs_gen_binary', f'bisquit/qasm/{f}', output_file, '-s', stats_file, '-p', '1000000', *shlex.split(extra_options)]
+    print(shlex.join(cmd))
+    subprocess.run(cmd, check=True)
+    subprocess.run(['xz', '-z', '-T', str(max(NUM_THREADS//NUM_JOBS, 1)), output_file], check=True)
 
 def build_binaries(tag=None, extra_options=''):
-    for f in files:
-        f_part = f.split('.')
-        filename = f_part[0]
-        if tag is None:
-            output_file = f'benchmarks/bin/BQ_{filename}'
-            stats_file = f'benchmarks/stats/BQ_{filename}.txt'
-        else:
-            output_file = f'benchmarks/bin/BQ_{filename}.{tag}'
-            stats_file = f'benchmarks/stats/BQ_{filename}.{tag}.txt'
-
-        cmd = f'./build/qs_gen_binary bisquit/qasm/{f} {output_file} -s {stats_file} -p 1000000 {extra_options} && xz -z -T {NUM_THREADS} {output_file}'
-        print(cmd)
-        os.system(cmd)
+    # each job just waits on its subprocesses, so threads are enough to run them in parallel
+    with ThreadPoolExecutor(max_workers=NUM_JOBS) as executor:
+        list(executor.map(lambda f: build_binary(f, tag, extra_options), files))
 
 from sys import argv
 
@@ -1,6 +1,9 @@
 # author: Suhas Vittal
 
 import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 EXECUTABLE = 'qs_gen_binary'
 QB_FOLDER = 'QASMBench/large'
@@ -11,8 +14,8 @@ B_STATS_FOLDER = 'benchmarks/stats'
 os.system(f'rm -rf {B_BIN_FOLDER}/QB_L_*')
 os.system(f'rm -rf {B_STATS_FOLDER}/QB_L_*')
 
-os.system(f'mkdir -p {B_BIN_FOLDER}')
-os.system(f'mkdir -p {B_STATS_FOLDER}')
+os.makedirs(B_BIN_FOLDER, exist_ok=True)
+os.makedirs(B_STATS_FOLDER, exist_ok=True)
 
 SKIP = [
     'adder',
@@ -30,18 +33,24 @@ SKIP = [
     'wstate'
 ]
 
-b_count = 0
-for f in os.listdir(QB_FOLDER):
-    # skip certain benchmarks (badly made, compressed, uninteresting, etc.)
-    if any(f'{s}_' in f for s in SKIP):
-        continue
-
+def generate_binary(f: str) -> int:
     file_path = f'{QB_FOLDER}/{f}/{f}.qasm'
     output_path = f'{B_BIN_FOLDER}/QB_L_{f}.gz'
     stats_path = f'{B_STATS_FOLDER}/QB_L_{f}.txt'
 
     print(f'{f}: Generating {output_path} and {stats_path}...')
-    os.system(f'./build/{EXECUTABLE} {file_path} {output_path} {stats_path}')
+    return subprocess.run([f'./build/{EXECUTABLE}', file_path, output_path, stats_path]).returncode
+
+# each benchmark is in its own folder -- skip certain benchmarks (badly made, compressed, uninteresting, etc.)
+benchmarks = [e.name for e in os.scandir(QB_FOLDER) if e.is_dir() and not any(f'{s}_' in e.name for s in SKIP)]
+
+# the benchmarks are independent and each job just waits on its subprocess, so run them on a thread pool
+with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+    return_codes = list(executor.map(generate_binary, benchmarks))
 
-    b_count += 1
-print(f'Generated {b_count} binaries')
\ No newline at end of file
+failed = [f for (f, rc) in zip(benchmarks, return_codes) if rc != 0]
+for f in failed:
+    print(f'{f}: {EXECUTABLE} failed')
+print(f'Generated {len(benchmarks) - len(failed)} binaries')
+if failed:
+    sys.exit(1)
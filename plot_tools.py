@@ -9,15 +9,40 @@ This module provides functions to:
 
 import re
 import os
+import argparse
+import sys
+import io
 import json
+import mmap
+import functools
+import contextlib
 import numpy as np
+import matplotlib
+# Plots are written with savefig, so render off-screen unless a backend was chosen explicitly
+# (MPLBACKEND) or we are running inside a notebook kernel, whose inline backend displays the figures
+if 'MPLBACKEND' not in os.environ and 'ipykernel' not in sys.modules:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from typing import Dict, List, Union, Optional, Tuple, Any
-from scipy.stats import gmean
+from matplotlib.colors import to_rgba_array
+from matplotlib.patches import Patch, Rectangle
+from matplotlib.collections import PatchCollection
+from matplotlib.container import BarContainer
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Set, Union, Optional, Tuple, Any
 
 ############################################
 ############################################
 
+def configure_interactive(backend: Optional[str] = None) -> None:
+    """
+    Switch matplotlib to an interactive backend, e.g. to open plt.show() windows.
+
+    Args:
+        backend: Backend to use. If None, lets matplotlib pick the default for this platform
+    """
+    plt.switch_backend(backend if backend is not None else matplotlib.rcParamsDefault['backend'])
+    plt.ion()
+
 def pretty_print_dict(data: Dict[str, Any], indent: int = 2, max_width: int = 80) -> None:
     """
     Print a dictionary in a JSON-like format for better readability.
@@ -37,58 +62,125 @@ def pretty_print_dict(data: Dict[str, Any], indent: int = 2, max_width: int = 80
           }
         }
     """
-    def _format_value(value: Any, current_indent: int) -> str:
-        """Format a value with proper indentation."""
+    # indentation strings by depth, extended as deeper values are reached
+    indents = [""]
+    def _indent(depth: int) -> str:
+        while len(indents) <= depth:
+            indents.append(" " * (indent * len(indents)))
+        return indents[depth]
+
+    def _format_scalar(value: Any) -> str:
+        """Format a value that is not a dict, list or tuple."""
+        if isinstance(value, str):
+            return json.dumps(value)  # Properly escape strings
+
+        elif isinstance(value, float):
+            # Format floats with reasonable precision
+            magnitude = abs(value)
+            if magnitude >= 1e6 or (magnitude < 1e-3 and value != 0):
+                return f"{value:.6e}"
+            else:
+                return f"{value:.6g}"
+
+        else:
+            return str(value)
+
+    # Walk the data with an explicit stack instead of recursing, writing every piece into one buffer.
+    # Entries are either text to write as-is or (value, depth) pairs still to be formatted; the
+    # pieces of a container are pushed in reverse so they are popped in order.
+    buf = io.StringIO()
+    stack: List[Any] = [(data, 0)]
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            buf.write(entry)
+            continue
+
+        value, depth = entry
         if isinstance(value, dict):
             if not value:
-                return "{}"
+                buf.write("{}")
+                continue
 
-            lines = ["{"]
-            for i, (k, v) in enumerate(value.items()):
-                comma = "," if i < len(value) - 1 else ""
-                formatted_value = _format_value(v, current_indent + indent)
-                lines.append(f"{' ' * (current_indent + indent)}\"{k}\": {formatted_value}{comma}")
-            lines.append(f"{' ' * current_indent}}}")
-            return "\n".join(lines)
+            buf.write("{")
+            child_indent = "\n" + _indent(depth + 1)
+            stack.append("\n" + _indent(depth) + "}")
+            for i, (k, v) in enumerate(reversed(value.items())):
+                if i > 0:
+                    stack.append(",")
+                stack.append((v, depth + 1))
+                stack.append(f"{child_indent}\"{k}\": ")
 
         elif isinstance(value, (list, tuple)):
             if not value:
-                return "[]"
+                buf.write("[]")
+                continue
 
             # For short lists, keep on one line
             if len(value) <= 3 and all(not isinstance(v, (dict, list, tuple)) for v in value):
                 formatted_items = [json.dumps(v) if isinstance(v, str) else str(v) for v in value]
                 one_line = f"[{', '.join(formatted_items)}]"
-                if len(one_line) <= max_width - current_indent:
-                    return one_line
+                if len(one_line) <= max_width - indent * depth:
+                    buf.write(one_line)
+                    continue
 
             # Multi-line format for longer lists
-            lines = ["["]
-            for i, item in enumerate(value):
-                comma = "," if i < len(value) - 1 else ""
-                formatted_item = _format_value(item, current_indent + indent)
-                lines.append(f"{' ' * (current_indent + indent)}{formatted_item}{comma}")
-            lines.append(f"{' ' * current_indent}]")
-            return "\n".join(lines)
-
-        elif isinstance(value, str):
-            return json.dumps(value)  # Properly escape strings
-
-        elif isinstance(value, float):
-            # Format floats with reasonable precision
-            if abs(value) >= 1e6 or (abs(value) < 1e-3 and value != 0):
-                return f"{value:.6e}"
-            else:
-                return f"{value:.6g}"
+            buf.write("[")
+            child_indent = "\n" + _indent(depth + 1)
+            stack.append("\n" + _indent(depth) + "]")
+            for i, item in enumerate(reversed(value)):
+                if i > 0:
+                    stack.append(",")
+                stack.append((item, depth + 1))
+                stack.append(child_indent)
 
         else:
-            return str(value)
+            buf.write(_format_scalar(value))
 
-    print(_format_value(data, 0))
+    print(buf.getvalue())
 
 ############################################
 ############################################
 
+# Files at least this large are memory-mapped rather than read into memory.
+_MMAP_THRESHOLD = 1 << 20
+
+@contextlib.contextmanager
+def _open_output_file(file_path: str):
+    """
+    Yield the contents of an output file as a bytes-like buffer for the regex scanners.
+    Large files are memory-mapped; smaller ones are read with a single unbuffered read.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.readall()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+# Matches `STAT_NAME    VALUE ...` lines in compiler output. Progress lines
+# (e.g. `[ MEMOPT ] progress: ...`) never match since the line must begin with the name.
+_COMPILER_STAT_RE = re.compile(rb'^[ \t]*([A-Z_]+)[ \t]+(\d[^\n]*)$', re.M)
+
+def _parse_stat_value(value_str: str) -> Union[int, float, str]:
+    """
+    Convert a statistic value to int or float when it looks numeric. Integers are
+    recognized with a single scan; anything else is handed to float(), which also
+    accepts scientific notation, `nan` and `inf`.
+    """
+    try:
+        return int(value_str) if value_str.lstrip('-').isdecimal() else float(value_str)
+    except ValueError:
+        # Keep as string if can't parse as number
+        return value_str
+
+def _parse_stat_bytes(value: bytes) -> Optional[Union[int, float]]:
+    """Bytes counterpart of `_parse_stat_value`; returns None for non-numeric values."""
+    try:
+        return int(value) if value.lstrip(b'-').isdigit() else float(value)
+    except ValueError:
+        return None
+
 def parse_compiler_output(file_path: str) -> Dict[str, Union[int, float]]:
     """
     Parse compiler output files and return a dictionary of statistics.
@@ -107,29 +199,14 @@ def parse_compiler_output(file_path: str) -> Dict[str, Union[int, float]]:
     stats = {}
     
     try:
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            line = line.strip()
-            # Skip progress lines and empty lines
-            if line.startswith('[ MEMOPT ] progress:') or not line:
-                continue
-            
-            # Parse statistic lines (format: STAT_NAME    VALUE)
-            if re.match(r'^[A-Z_]+\s+\d+', line):
-                parts = line.split()
-                if len(parts) >= 2:
-                    stat_name = parts[0]
-                    try:
-                        # Try to parse as int first, then float
-                        value = int(parts[-1])
-                    except ValueError:
-                        try:
-                            value = float(parts[-1])
-                        except ValueError:
-                            continue
-                    stats[stat_name] = value
+        with _open_output_file(file_path) as data:
+            for m in _COMPILER_STAT_RE.finditer(data):
+                # int() and float() accept bytes, so only the name is decoded
+                value = _parse_stat_bytes(m.group(2).split()[-1])
+                # Skip non-numeric values
+                if value is None:
+                    continue
+                stats[m.group(1).decode('ascii')] = value
                     
     except FileNotFoundError:
         print(f"Warning: File {file_path} not found")
@@ -141,12 +218,23 @@ def parse_compiler_output(file_path: str) -> Dict[str, Union[int, float]]:
 ############################################
 ############################################
 
-def parse_simulator_output(file_path: str) -> Dict[str, Union[int, float, Dict]]:
+# Classifies each line in one match: section headers are unindented lines without a colon;
+# statistics are `key: value` lines, which belong to the current section when indented.
+# Lines that are neither (blank or indented without a colon) never match.
+_SIM_LINE_RE = re.compile(rb'^(?:(?P<header>[^ \n:][^\n:]*)|(?P<key>[^\n:]*):(?P<value>[^\n]*))$', re.M)
+
+def parse_simulator_output(
+    file_path: str,
+    keys: Optional[Set[Union[str, Tuple[str, str]]]] = None
+) -> Dict[str, Union[int, float, Dict]]:
     """
     Parse simulator output files and return a dictionary with potentially nested statistics.
 
     Args:
         file_path: Path to the simulator output file (.out)
+        keys: If given, stop reading the file as soon as all of these statistics have been
+              parsed. Each is either a top-level statistic name or a (section, statistic) pair.
+              The returned dictionary then only holds the statistics before that point.
 
     Returns:
         Dictionary with statistic names as keys. Values can be numbers or nested dictionaries
@@ -159,77 +247,42 @@ def parse_simulator_output(file_path: str) -> Dict[str, Union[int, float, Dict]]
     """
     stats = {}
     current_section = None
+    remaining = set(keys) if keys else None
 
     try:
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-        for line_raw in lines:
-            line = line_raw.rstrip()  # Keep leading spaces but remove trailing whitespace
-
-            # Skip empty lines and section headers
-            if not line or line.startswith('---') or 'SIMULATION_STATS' in line:
-                continue
-
-            # Check for section headers (lines with no leading spaces, no colon, and uppercase)
-            if not line.startswith(' ') and ':' not in line:
-                # This is a section header
-                current_section = line.strip()
-                if current_section not in stats:
-                    stats[current_section] = {}
-                continue
-
-            # Parse key-value pairs
-            if ':' in line:
-                if line.startswith(' ') and current_section:
+        with _open_output_file(file_path) as data:
+            for m in _SIM_LINE_RE.finditer(data):
+                line = m.group(0)
+                # Skip separators and the SIMULATION_STATS banner
+                if line.startswith(b'---') or b'SIMULATION_STATS' in line:
+                    continue
+
+                if m.lastgroup == 'header':
+                    section = line.strip()
+                    if not section:
+                        continue
+                    current_section = section.decode()
+                    if current_section not in stats:
+                        stats[current_section] = {}
+                    continue
+
+                key = m.group('key').strip().decode()
+                value = _parse_stat_value(m.group('value').strip().decode())
+                if line.startswith(b' ') and current_section:
                     # This is an indented line belonging to current section
-                    clean_line = line.lstrip()
-                    parts = clean_line.split(':', 1)
-
-                    if len(parts) == 2:
-                        key = parts[0].strip()
-                        value_str = parts[1].strip()
-
-                        # Try to parse the value
-                        try:
-                            # Handle scientific notation and regular numbers
-                            if 'e' in value_str.lower() or ('.' in value_str and value_str.replace('.', '').replace('-', '').isdigit()):
-                                value = float(value_str)
-                            elif value_str.lstrip('-').isdigit():
-                                value = int(value_str)
-                            else:
-                                value = value_str
-                        except ValueError:
-                            # Keep as string if can't parse as number
-                            value = value_str
-
-                        # Store in current section
-                        stats[current_section][key] = value
-
+                    stats[current_section][key] = value
+                    found = (current_section, key)
                 else:
                     # This is a top-level statistic (not indented)
-                    clean_line = line.strip()
-                    parts = clean_line.split(':', 1)
-
-                    if len(parts) == 2:
-                        key = parts[0].strip()
-                        value_str = parts[1].strip()
-
-                        # Try to parse the value
-                        try:
-                            if 'e' in value_str.lower() or ('.' in value_str and value_str.replace('.', '').replace('-', '').isdigit()):
-                                value = float(value_str)
-                            elif value_str.lstrip('-').isdigit():
-                                value = int(value_str)
-                            else:
-                                value = value_str
-                        except ValueError:
-                            value = value_str
-
-                        # Store as top-level statistic
-                        stats[key] = value
-                        # Reset current section since we hit a top-level stat
-                        current_section = None
+                    stats[key] = value
+                    # Reset current section since we hit a top-level stat
+                    current_section = None
+                    found = key
+
+                if remaining is not None:
+                    remaining.discard(found)
+                    if not remaining:
+                        break
 
     except FileNotFoundError:
         print(f"Warning: File {file_path} not found")
@@ -238,9 +291,175 @@ def parse_simulator_output(file_path: str) -> Dict[str, Union[int, float, Dict]]
 
     return stats
 
+def _lookup_statistic(stats: Dict[str, Any], section: Optional[str], statistic: str) -> Optional[Union[int, float, str]]:
+    """Find `statistic` in `section` of parsed stats, falling back to a top-level statistic."""
+    # Handle both nested and top-level statistics
+    if section and section in stats and isinstance(stats[section], dict) and statistic in stats[section]:
+        return stats[section][statistic]
+    return stats.get(statistic)
+
+def parse_simulator_stat(file_path: str, section: Optional[str], statistic: str) -> Optional[Union[int, float, str]]:
+    """
+    Read a single statistic from a simulator output file, parsing only as far as needed.
+
+    Args:
+        file_path: Path to the simulator output file (.out)
+        section: Section containing the statistic (e.g., "CLIENT_0"), or None for a top-level statistic
+        statistic: Name of the statistic (e.g., "KIPS")
+
+    Returns:
+        The statistic's value, or None if it is not in the file. As with the barplots, a top-level
+        statistic of the same name is used if the section does not have it.
+
+    Example:
+        >>> parse_simulator_stat("out/qmem/simulation_results/dpt/cr2_120_c12.out", "CLIENT_0", "KIPS")
+        0.357558
+    """
+    stats = parse_simulator_output(file_path, keys={(section, statistic) if section else statistic})
+    return _lookup_statistic(stats, section, statistic)
+
 ############################################
 ############################################
 
+@functools.lru_cache(maxsize=4096)
+def _parse_simulator_stat_cached(
+    abs_path: str,
+    stamp: Optional[Tuple[int, int]],
+    section: Optional[str],
+    statistic: str
+) -> Optional[Union[int, float, str]]:
+    return parse_simulator_stat(abs_path, section, statistic)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_compiler_output_cached(abs_path: str, stamp: Optional[Tuple[int, int]]) -> Dict[str, Union[int, float]]:
+    return parse_compiler_output(abs_path)
+
+def _read_statistic(
+    file_path: str,
+    is_simulation_stats: bool,
+    section: Optional[str],
+    statistic: str
+) -> Optional[Union[int, float, str]]:
+    """
+    Read one statistic from an output file (see `_lookup_statistic`), or None if it is missing.
+    Simulator output is only parsed up to the statistic. Results are reused if the file has not
+    been modified since (same modification time and size).
+    """
+    abs_path = os.path.abspath(file_path)
+    try:
+        st = os.stat(abs_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    if is_simulation_stats:
+        return _parse_simulator_stat_cached(abs_path, stamp, section, statistic)
+    else:
+        return _lookup_statistic(_parse_compiler_output_cached(abs_path, stamp), section, statistic)
+
+def clear_parse_cache() -> None:
+    """Drop all cached parse results (see `_read_statistic`)."""
+    _parse_simulator_stat_cached.cache_clear()
+    _parse_compiler_output_cached.cache_clear()
+
+############################################
+############################################
+
+def _relative_performance(
+    stat_matrix: np.ndarray,
+    baseline_row: np.ndarray,
+    percent_improvement: bool,
+    plotting_slowdown: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalize each row of `stat_matrix` (one row per policy, one column per workload) to
+    `baseline_row` and compute the geometric mean of each row.
+
+    Workloads with a non-positive baseline get a relative value of 0 and, like any other
+    non-positive relative value, are excluded from the geometric mean. A row with no
+    valid values has a geometric mean of 0.
+
+    Returns:
+        Tuple of (relative values with the same shape as `stat_matrix`, geometric mean per row)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = np.where(baseline_row > 0, stat_matrix / baseline_row, 0.0)
+        if plotting_slowdown:
+            relative = np.where(relative != 0, 1.0 / relative, 0.0)
+
+        valid = relative > 0
+        counts = valid.sum(axis=1)
+        log_sums = np.log(np.where(valid, relative, 1.0)).sum(axis=1)
+        geomeans = np.where(counts > 0, np.exp(log_sums / np.maximum(counts, 1)), 0.0)
+
+    # Convert to percentage improvement if requested
+    if percent_improvement:
+        relative = (relative - 1) * 100
+        geomeans = np.where(counts > 0, (geomeans - 1) * 100, 0.0)
+    return relative, geomeans
+
+############################################
+############################################
+
+def _format_bar_labels(values: np.ndarray, percent_improvement: bool) -> List[str]:
+    """
+    Format the value annotations drawn on top of each bar.
+
+    Args:
+        values: Bar heights
+        percent_improvement: If True, format as percentages (no decimals at or above 100%)
+
+    Returns:
+        One label string per bar
+    """
+    if percent_improvement:
+        return [f'{v:.0f}%' if abs(v) >= 100 else f'{v:.1f}%' for v in values]
+    return [f'{v:.2f}' for v in values]
+
+def _draw_bar_groups(
+    ax: plt.Axes,
+    positions: np.ndarray,
+    heights: np.ndarray,
+    width: float,
+    colors: List,
+    labels: List[str],
+    show_values: bool,
+    percent_improvement: bool
+) -> List[Patch]:
+    """
+    Draw all bars of a grouped barplot as a single PatchCollection, which matplotlib renders
+    in one draw call instead of one per bar.
+
+    Args:
+        ax: Axes to draw on
+        positions: Bar x positions, one row per group (policy or configuration)
+        heights: Bar heights, same shape as `positions`
+        width: Width of each bar
+        colors: Color of each row's bars
+        labels: Legend label of each row
+        show_values: Whether to annotate each bar with its value
+        percent_improvement: Passed to `_format_bar_labels`
+
+    Returns:
+        One legend handle per row, since the bars are not individual artists
+    """
+    num_rows, num_cols = heights.shape
+    bar_heights = heights.ravel()
+    rects = [Rectangle((x, 0), width, h) for x, h in zip((positions.ravel() - width/2).tolist(), bar_heights.tolist())]
+    bar_colors = np.repeat(to_rgba_array([colors[i] for i in range(num_rows)], alpha=0.8), num_cols, axis=0)
+    bars = PatchCollection(rects, facecolors=bar_colors, edgecolors='none')
+    # Keep the y-axis anchored at 0, as `ax.bar` does
+    bars.sticky_edges.y.append(0)
+    ax.add_collection(bars)
+    ax.autoscale_view()
+
+    if show_values:
+        # bar_label only needs the bar geometry, which the container provides
+        container = BarContainer(rects, datavalues=bar_heights, orientation='vertical')
+        ax.add_container(container)
+        ax.bar_label(container, labels=_format_bar_labels(bar_heights, percent_improvement),
+                     fontsize=8, padding=2)
+    return [Patch(facecolor=colors[i], alpha=0.8, label=labels[i]) for i in range(num_rows)]
+
 def create_performance_barplot(
     baseline_policy: str,
     policies: List[str],
@@ -307,75 +526,34 @@ def create_performance_barplot(
         ... )
         >>> plt.show()
     """
-    # Collect statistic data for all policies and workloads
+    # Collect statistic data for all policies and workloads, keyed by (policy, workload)
     stat_data = {}
 
     policy_plus_baseline = [baseline_policy, *policies]
+    tasks = []
     for policy in policy_plus_baseline:
-        stat_data[policy] = {}
-
-        for workload in workloads:
-            # Construct file path - baseline has different naming convention
-            if ext is None or policy == 'baseline':
-                file_path = os.path.join(data_dir, policy, f"{workload}.out")
-            else:
-                file_path = os.path.join(data_dir, policy, f"{workload}_{ext}.out")
-
-            # Parse the file and extract the requested statistic
-            if is_simulation_stats:
-                stats = parse_simulator_output(file_path)
-            else:
-                stats = parse_compiler_output(file_path)
-
-            # Handle both nested and top-level statistics
-            if section and section in stats and isinstance(stats[section], dict) and statistic in stats[section]:
-                stat_data[policy][workload] = stats[section][statistic]
-            elif statistic in stats:
-                # Top-level statistic
-                stat_data[policy][workload] = stats[statistic]
-            else:
-                print(f"Warning: {statistic} not found in section '{section}' in {file_path}")
-                stat_data[policy][workload] = 0
+        # Construct file paths from the policy directory - baseline has different naming convention
+        policy_dir = os.path.join(data_dir, policy, '')
+        suffix = '.out' if ext is None or policy == 'baseline' else f'_{ext}.out'
+        tasks.extend((policy, workload, policy_dir + workload + suffix) for workload in workloads)
+
+    # Parse the files concurrently -- the file reads release the GIL
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(tasks)))) as executor:
+        values = list(executor.map(lambda t: _read_statistic(t[2], is_simulation_stats, section, statistic), tasks))
+
+    for (policy, workload, file_path), value in zip(tasks, values):
+        if value is None:
+            print(f"Warning: {statistic} not found in section '{section}' in {file_path}")
+            value = 0
+        stat_data[(policy, workload)] = value
     
-    # Calculate relative performance (normalized to baseline)
-    relative_data = {}
-    baseline_stats = stat_data.get(baseline_policy, {})
-
-    for policy in policies:
-        relative_data[policy] = []
-        for workload in workloads:
-            if workload in baseline_stats and baseline_stats[workload] > 0:
-                relative_perf = stat_data[policy][workload] / baseline_stats[workload]
-            else:
-                relative_perf = 0
-            if plotting_slowdown:
-                relative_perf = 1.0/relative_perf
-            relative_data[policy].append(relative_perf)
-    
-    # Convert to percentage improvement if requested
-    if percent_improvement:
-        for policy in policies:
-            relative_data[policy] = [(x - 1) * 100 for x in relative_data[policy]]
-
-    # Calculate geometric means
-    geomeans = {}
-    for policy in policies:
-        if percent_improvement:
-            # For percentage improvement, calculate geomean of (1 + improvement/100) then convert back
-            values = [x for x in relative_data[policy] if x > -100]  # Avoid values that would make (1 + x/100) <= 0
-            if values:
-                # Convert back to relative values, calculate geomean, then convert to percentage
-                relative_values = [(x / 100) + 1 for x in values]
-                geomean_relative = gmean(relative_values)
-                geomeans[policy] = (geomean_relative - 1) * 100
-            else:
-                geomeans[policy] = 0
-        else:
-            values = [x for x in relative_data[policy] if x > 0]
-            if values:
-                geomeans[policy] = gmean(values)
-            else:
-                geomeans[policy] = 0
+    # Calculate relative performance (normalized to baseline) and geometric means
+    stat_matrix = np.fromiter((stat_data[(policy, workload)] for policy in policies for workload in workloads),
+                              dtype=np.float64, count=len(policies)*len(workloads))
+    stat_matrix = stat_matrix.reshape(len(policies), len(workloads))
+    baseline_row = np.fromiter((stat_data[(baseline_policy, workload)] for workload in workloads),
+                               dtype=np.float64, count=len(workloads))
+    relative_data, geomeans = _relative_performance(stat_matrix, baseline_row, percent_improvement, plotting_slowdown)
     
     # Set up the plot
     fig, ax = plt.subplots()
@@ -393,48 +571,22 @@ def create_performance_barplot(
     if colors is None:
         colors = plt.cm.Set1(np.linspace(0, 1, len(policies)))
     
-    # Calculate bar positions
+    # Calculate bar positions and y values (workloads + geomean), one row per policy
     bar_width_individual = bar_width / len(policies)
+    offsets = (np.arange(len(policies)) - len(policies)/2 + 0.5) * bar_width_individual
+    positions = x_pos[None, :] + offsets[:, None]
+    y_matrix = np.concatenate([relative_data, geomeans[:, None]], axis=1)
     
-    for i, policy in enumerate(policies):
-        # Prepare y values (workloads + geomean)
-        y_values = relative_data[policy] + [geomeans[policy]]
-        # Calculate x positions for this policy's bars
-        x_positions = x_pos + (i - len(policies)/2 + 0.5) * bar_width_individual
-        
-        # Create bars
-        label = legend_labels[i] if legend_labels and i < len(legend_labels) else policy
-        bars = ax.bar(x_positions, y_values, bar_width_individual,
-                     label=label, color=colors[i], alpha=0.8)
-        
-        # Add value labels on bars if requested
-        if show_values:
-            for bar, value in zip(bars, y_values):
-                if percent_improvement:
-                    # Format percentage values
-                    if abs(value) >= 100:
-                        label = f'{value:.0f}%'
-                    else:
-                        label = f'{value:.1f}%'
-                else:
-                    # Format relative values
-                    label = f'{value:.2f}'
-
-                # Position label above or below bar depending on value
-                if value >= 0:
-                    y_pos = bar.get_height() + (0.01 if not percent_improvement else 1)
-                    va = 'bottom'
-                else:
-                    y_pos = bar.get_height() - (0.01 if not percent_improvement else 1)
-                    va = 'top'
-
-                ax.text(bar.get_x() + bar.get_width()/2, y_pos, label,
-                       ha='center', va=va, fontsize=8)
+    # Create bars, with value labels on bars if requested
+    labels = [legend_labels[i] if legend_labels and i < len(legend_labels) else policy
+              for i, policy in enumerate(policies)]
+    handles = _draw_bar_groups(ax, positions, y_matrix, bar_width_individual, colors, labels,
+                               show_values, percent_improvement)
     
     # Customize the plot\
     ax.set_ylabel(ylabel, fontsize=ylabel_fontsize)
     ax.set_xticks(x_pos, labels=x_labels, fontsize=xlabel_fontsize, rotation=20, ha='right')
-    ax.legend(fontsize=10)
+    ax.legend(handles=handles, fontsize=10)
 
     # Add y-axis grid lines (light grey in background)
     ax.grid(True, axis='y', color='lightgrey', linestyle='-', alpha=0.7)
@@ -523,75 +675,35 @@ def create_sensitivity_barplot(
         ... )
         >>> plt.show()
     """
-    # Collect statistic data for all configurations and workloads
+    # Collect statistic data for all configurations and workloads, keyed by (config, workload)
     stat_data = {}
 
+    tasks = []
+    policy_dir = os.path.join(data_dir, policy, '')
     for config in configurations:
-        stat_data[config] = {}
-
-        for workload in workloads:
-            # Construct file path: policy/workload_config.out
-            if ext is None:
-                file_path = os.path.join(data_dir, policy, f"{workload}_{config}.out")
-            else:
-                file_path = os.path.join(data_dir, policy, f"{workload}_{ext}.out")
-
-            # Parse the file and extract the requested statistic
-            if is_simulation_stats:
-                stats = parse_simulator_output(file_path)
-            else:
-                stats = parse_compiler_output(file_path)
-
-            # Handle both nested and top-level statistics
-            if section and section in stats and isinstance(stats[section], dict) and statistic in stats[section]:
-                stat_data[config][workload] = stats[section][statistic]
-            elif statistic in stats:
-                # Top-level statistic
-                stat_data[config][workload] = stats[statistic]
-            else:
-                print(f"Warning: {statistic} not found in section '{section}' in {file_path}")
-                stat_data[config][workload] = 0
-
-
-    # Calculate relative performance (normalized to baseline configuration)
-    relative_data = {}
-    baseline_stats = stat_data.get(baseline_config, {})
-
-    for config in configurations:
-        relative_data[config] = []
-        for workload in workloads:
-            if workload in baseline_stats and baseline_stats[workload] > 0:
-                relative_perf = stat_data[config][workload] / baseline_stats[workload]
-            else:
-                relative_perf = 0
-            if plotting_slowdown:
-                relative_perf = 1.0/relative_perf
-            relative_data[config].append(relative_perf)
-
-    # Convert to percentage improvement if requested
-    if percent_improvement:
-        for config in configurations:
-            relative_data[config] = [(x - 1) * 100 for x in relative_data[config]]
-
-    # Calculate geometric means
-    geomeans = {}
-    for config in configurations:
-        if percent_improvement:
-            # For percentage improvement, calculate geomean of (1 + improvement/100) then convert back
-            values = [x for x in relative_data[config] if x > -100]  # Avoid values that would make (1 + x/100) <= 0
-            if values:
-                # Convert back to relative values, calculate geomean, then convert to percentage
-                relative_values = [(x / 100) + 1 for x in values]
-                geomean_relative = gmean(relative_values)
-                geomeans[config] = (geomean_relative - 1) * 100
-            else:
-                geomeans[config] = 0
-        else:
-            values = [x for x in relative_data[config] if x > 0]
-            if values:
-                geomeans[config] = gmean(values)
-            else:
-                geomeans[config] = 0
+        # Construct file paths: policy/workload_config.out
+        suffix = f'_{config}.out' if ext is None else f'_{ext}.out'
+        tasks.extend((config, workload, policy_dir + workload + suffix) for workload in workloads)
+
+    # Parse the files concurrently -- the file reads release the GIL
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(tasks)))) as executor:
+        values = list(executor.map(lambda t: _read_statistic(t[2], is_simulation_stats, section, statistic), tasks))
+
+    for (config, workload, file_path), value in zip(tasks, values):
+        if value is None:
+            print(f"Warning: {statistic} not found in section '{section}' in {file_path}")
+            value = 0
+        stat_data[(config, workload)] = value
+
+    # Calculate relative performance (normalized to baseline configuration) and geometric means
+    stat_matrix = np.fromiter((stat_data[(config, workload)] for config in configurations for workload in workloads),
+                              dtype=np.float64, count=len(configurations)*len(workloads))
+    stat_matrix = stat_matrix.reshape(len(configurations), len(workloads))
+    if baseline_config in configurations:
+        baseline_row = stat_matrix[configurations.index(baseline_config)]
+    else:
+        baseline_row = np.zeros(len(workloads))
+    relative_data, geomeans = _relative_performance(stat_matrix, baseline_row, percent_improvement, plotting_slowdown)
 
     # Set up the plot
     fig, ax = plt.subplots(figsize=figsize)
@@ -607,51 +719,24 @@ def create_sensitivity_barplot(
     if colors is None:
         colors = plt.cm.Set1(np.linspace(0, 1, len(configurations)))
 
-    # Calculate bar positions
+    # Calculate bar positions and y values (workloads + geomean), one row per configuration
     bar_width_individual = bar_width / len(configurations)
+    offsets = (np.arange(len(configurations)) - len(configurations)/2 + 0.5) * bar_width_individual
+    positions = x_pos[None, :] + offsets[:, None]
+    y_matrix = np.concatenate([relative_data, geomeans[:, None]], axis=1)
 
-    for i, config in enumerate(configurations):
-        # Prepare y values (workloads + geomean)
-        y_values = relative_data[config] + [geomeans[config]]
-
-        # Calculate x positions for this configuration's bars
-        x_positions = x_pos + (i - len(configurations)/2 + 0.5) * bar_width_individual
-
-        # Create bars
-        label = legend_labels[i] if legend_labels and i < len(legend_labels) else config
-        bars = ax.bar(x_positions, y_values, bar_width_individual,
-                     label=label, color=colors[i], alpha=0.8)
-
-        # Add value labels on bars if requested
-        if show_values:
-            for bar, value in zip(bars, y_values):
-                if percent_improvement:
-                    # Format percentage values
-                    if abs(value) >= 100:
-                        label_text = f'{value:.0f}%'
-                    else:
-                        label_text = f'{value:.1f}%'
-                else:
-                    # Format relative values
-                    label_text = f'{value:.2f}'
-
-                # Position label above or below bar depending on value
-                if value >= 0:
-                    y_pos = bar.get_height() + (0.01 if not percent_improvement else 1)
-                    va = 'bottom'
-                else:
-                    y_pos = bar.get_height() - (0.01 if not percent_improvement else 1)
-                    va = 'top'
-
-                ax.text(bar.get_x() + bar.get_width()/2, y_pos, label_text,
-                       ha='center', va=va, fontsize=8)
+    # Create bars, with value labels on bars if requested
+    labels = [legend_labels[i] if legend_labels and i < len(legend_labels) else config
+              for i, config in enumerate(configurations)]
+    handles = _draw_bar_groups(ax, positions, y_matrix, bar_width_individual, colors, labels,
+                               show_values, percent_improvement)
 
     # Customize the plot
     ax.set_xlabel('Workload', fontsize=xlabel_fontsize)
     ax.set_ylabel(ylabel, fontsize=ylabel_fontsize)
     ax.set_xticks(x_pos)
     ax.set_xticklabels(x_labels)
-    ax.legend()
+    ax.legend(handles=handles)
 
     # Add y-axis grid lines (light grey in background)
     ax.grid(True, axis='y', color='lightgrey', linestyle='-', alpha=0.7)
@@ -717,9 +802,116 @@ def create_kips_barplot(
         legend_labels=legend_labels
     )
 
+############################################
+############################################
+
+# Example plots rendered by `__main__`: (name, description, barplot function, keyword arguments)
+_EXAMPLE_PLOTS = [
+    ("kips", "KIPS barplot", create_performance_barplot, dict(
+        baseline_policy="baseline",
+        policies=["baseline", "dpt", "viszlai"],
+        workloads=["cr2_120", "ethylene_240", "hc3h2cn_288", "shor_RSA256"],
+        statistic="KIPS",
+        section="CLIENT_0",
+        ylabel="Relative KIPS",
+        ylabel_fontsize=14,
+        xlabel_fontsize=12,
+        figsize=(14, 6)
+    )),
+    ("memory_requests", "Memory requests barplot", create_performance_barplot, dict(
+        baseline_policy="baseline",
+        policies=["baseline", "dpt", "viszlai"],
+        workloads=["cr2_120", "ethylene_240"],
+        statistic="ALL_REQUESTS",
+        section="MEMORY",
+        ylabel="Relative Memory Requests",
+        ylabel_fontsize=14,
+        xlabel_fontsize=12,
+        figsize=(10, 6)
+    )),
+    ("kips_percent", "KIPS percentage improvement barplot", create_performance_barplot, dict(
+        baseline_policy="baseline",
+        policies=["baseline", "dpt", "viszlai"],
+        workloads=["cr2_120", "ethylene_240"],
+        statistic="KIPS",
+        section="CLIENT_0",
+        ylabel="KIPS Improvement (%)",
+        ylabel_fontsize=14,
+        xlabel_fontsize=12,
+        percent_improvement=True,
+        figsize=(10, 6)
+    )),
+    ("dpt_sensitivity", "DPT sensitivity study barplot", create_sensitivity_barplot, dict(
+        baseline_config="c4",
+        policy="dpt",
+        configurations=["c4", "c8", "c12", "c16", "c24"],
+        workloads=["cr2_120", "ethylene_240"],
+        statistic="KIPS",
+        section="CLIENT_0",
+        ylabel="Relative KIPS",
+        legend_labels=["4 cores", "8 cores", "12 cores", "16 cores", "24 cores"],
+        figsize=(12, 6)
+    )),
+    ("viszlai_sensitivity_percent", "Viszlai sensitivity study (percentage) barplot", create_sensitivity_barplot, dict(
+        baseline_config="c4",
+        policy="viszlai",
+        configurations=["c4", "c8", "c12"],
+        workloads=["cr2_120", "ethylene_240"],
+        statistic="KIPS",
+        section="CLIENT_0",
+        ylabel="KIPS Improvement (%)",
+        percent_improvement=True,
+        legend_labels=["4 cores", "8 cores", "12 cores"],
+        figsize=(10, 6)
+    )),
+    ("custom_legend", "Performance barplot with custom legend", create_performance_barplot, dict(
+        baseline_policy="baseline",
+        policies=["baseline", "dpt", "viszlai"],
+        workloads=["cr2_120", "ethylene_240"],
+        statistic="KIPS",
+        section="CLIENT_0",
+        ylabel="Relative KIPS",
+        legend_labels=["Baseline", "DPT Policy", "Viszlai Policy"],
+        figsize=(10, 6)
+    )),
+    ("dpt_sensitivity_slowdown", "Sensitivity study with slowdown mode", create_sensitivity_barplot, dict(
+        baseline_config="c4",
+        policy="dpt",
+        configurations=["c4", "c8", "c12"],
+        workloads=["cr2_120", "ethylene_240"],
+        statistic="KIPS",
+        section="CLIENT_0",
+        ylabel="Relative Slowdown",
+        plotting_slowdown=True,  # Plot slowdown instead of speedup
+        legend_labels=["4 cores", "8 cores", "12 cores"],
+        figsize=(10, 6)
+    )),
+]
+
+def _render_example(example: Tuple[str, str, Any, Dict[str, Any]], output_dir: Optional[str] = None) -> str:
+    """Create one of the `_EXAMPLE_PLOTS`, saving it to `output_dir` if given, and return a status message."""
+    name, description, plot_fn, kwargs = example
+    try:
+        fig = plot_fn(**kwargs)
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+            fig.savefig(os.path.join(output_dir, f"{name}.pdf"), bbox_inches='tight')
+        return f"{description} created successfully!"
+    except Exception as e:
+        return f"Error creating {description}: {e}"
+
 
 if __name__ == "__main__":
-    # Example usage
+    # Example usage. Plots render off-screen; set QS_PLOT_INTERACTIVE to open them in a window
+    parser = argparse.ArgumentParser(description="Run the plot_tools examples.")
+    parser.add_argument("--output-dir", help="Save each example plot as <output-dir>/<name>.pdf")
+    parser.add_argument("--singlecore", action="store_true", help="Render the example plots one after another")
+    args = parser.parse_args()
+
+    show_plots = bool(os.environ.get('QS_PLOT_INTERACTIVE'))
+    if show_plots:
+        configure_interactive()
+
     print("Testing compiler output parser:")
     compiler_stats = parse_compiler_output("out/qmem/compiled_results/dpt/cr2_120_c12.out")
     print("Sample compiler stats:")
@@ -734,140 +926,18 @@ if __name__ == "__main__":
         print(f"\nCLIENT_0 section:")
         pretty_print_dict({'CLIENT_0': sim_stats['CLIENT_0']})
 
-    print("\nTesting barplot creation (KIPS):")
-    try:
-        fig = create_performance_barplot(
-            baseline_policy="baseline",
-            policies=["baseline", "dpt", "viszlai"],
-            workloads=["cr2_120", "ethylene_240", "hc3h2cn_288", "shor_RSA256"],
-            statistic="KIPS",
-            section="CLIENT_0",
-            ylabel="Relative KIPS",
-            ylabel_fontsize=14,
-            xlabel_fontsize=12,
-            figsize=(14, 6)
-        )
-        print("KIPS barplot created successfully!")
-        # Uncomment the next line to display the plot
-        plt.show()
-    except Exception as e:
-        print(f"Error creating KIPS barplot: {e}")
-
-    print("\nTesting barplot creation (Memory Requests):")
-    try:
-        fig = create_performance_barplot(
-            baseline_policy="baseline",
-            policies=["baseline", "dpt", "viszlai"],
-            workloads=["cr2_120", "ethylene_240"],
-            statistic="ALL_REQUESTS",
-            section="MEMORY",
-            ylabel="Relative Memory Requests",
-            ylabel_fontsize=14,
-            xlabel_fontsize=12,
-            figsize=(10, 6)
-        )
-        print("Memory requests barplot created successfully!")
-        # Uncomment the next line to display the plot
-        plt.show()
-    except Exception as e:
-        print(f"Error creating memory requests barplot: {e}")
-
-    print("\nTesting KIPS barplot with percentage improvement:")
-    try:
-        fig = create_performance_barplot(
-            baseline_policy="baseline",
-            policies=["baseline", "dpt", "viszlai"],
-            workloads=["cr2_120", "ethylene_240"],
-            statistic="KIPS",
-            section="CLIENT_0",
-            ylabel="KIPS Improvement (%)",
-            ylabel_fontsize=14,
-            xlabel_fontsize=12,
-            percent_improvement=True,
-            figsize=(10, 6)
-        )
-        print("KIPS percentage improvement barplot created successfully!")
-        # Uncomment the next line to display the plot
-        # plt.show()
-    except Exception as e:
-        print(f"Error creating KIPS percentage improvement barplot: {e}")
-
-    print("\nTesting sensitivity study barplot (DPT core count):")
-    try:
-        fig = create_sensitivity_barplot(
-            baseline_config="c4",
-            policy="dpt",
-            configurations=["c4", "c8", "c12", "c16", "c24"],
-            workloads=["cr2_120", "ethylene_240"],
-            statistic="KIPS",
-            section="CLIENT_0",
-            ylabel="Relative KIPS",
-            legend_labels=["4 cores", "8 cores", "12 cores", "16 cores", "24 cores"],
-            figsize=(12, 6)
-        )
-        print("DPT sensitivity study barplot created successfully!")
-        # Uncomment the next line to display the plot
-        # plt.show()
-    except Exception as e:
-        print(f"Error creating DPT sensitivity study barplot: {e}")
-
-    print("\nTesting sensitivity study with percentage improvement:")
-    try:
-        fig = create_sensitivity_barplot(
-            baseline_config="c4",
-            policy="viszlai",
-            configurations=["c4", "c8", "c12"],
-            workloads=["cr2_120", "ethylene_240"],
-            statistic="KIPS",
-            section="CLIENT_0",
-            ylabel="KIPS Improvement (%)",
-            percent_improvement=True,
-            legend_labels=["4 cores", "8 cores", "12 cores"],
-            figsize=(10, 6)
-        )
-        print("Viszlai sensitivity study (percentage) barplot created successfully!")
-        # Uncomment the next line to display the plot
-        # plt.show()
-    except Exception as e:
-        print(f"Error creating Viszlai sensitivity study barplot: {e}")
-
-    print("\nTesting performance barplot with custom legend labels:")
-    try:
-        fig = create_performance_barplot(
-            baseline_policy="baseline",
-            policies=["baseline", "dpt", "viszlai"],
-            workloads=["cr2_120", "ethylene_240"],
-            statistic="KIPS",
-            section="CLIENT_0",
-            ylabel="Relative KIPS",
-            legend_labels=["Baseline", "DPT Policy", "Viszlai Policy"],
-            figsize=(10, 6)
-        )
-        print("Performance barplot with custom legend created successfully!")
-        # Uncomment the next line to display the plot
-        # plt.show()
-    except Exception as e:
-        print(f"Error creating performance barplot with custom legend: {e}")
-
-    print("\nTesting sensitivity study with new parameters (slowdown mode):")
-    try:
-        fig = create_sensitivity_barplot(
-            baseline_config="c4",
-            policy="dpt",
-            configurations=["c4", "c8", "c12"],
-            workloads=["cr2_120", "ethylene_240"],
-            statistic="KIPS",
-            section="CLIENT_0",
-            ylabel="Relative Slowdown",
-            plotting_slowdown=True,  # NEW: Plot slowdown instead of speedup
-            legend_labels=["4 cores", "8 cores", "12 cores"],
-            figsize=(10, 6)
-        )
-        print("Sensitivity study with slowdown mode created successfully!")
-        # Uncomment the next line to display the plot
-        # plt.show()
-    except Exception as e:
-        print(f"Error creating sensitivity study with slowdown mode: {e}")
+    print("\nTesting example barplots:")
+    # The example plots are independent, so render them in separate processes (matplotlib is not
+    # thread-safe). Interactive windows have to be opened from this process.
+    if args.singlecore or show_plots:
+        for example in _EXAMPLE_PLOTS:
+            print(_render_example(example, args.output_dir))
+            if show_plots:
+                plt.show()
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(_EXAMPLE_PLOTS), os.cpu_count() or 1)) as executor:
+            for message in executor.map(_render_example, _EXAMPLE_PLOTS, [args.output_dir] * len(_EXAMPLE_PLOTS)):
+                print(message)
 
     print("\nTesting pretty_print_dict with sample data:")
     sample_data = {
@@ -1,5 +1,6 @@
 # author: Suhas Vittal
 
+import functools
 import os
 from sys import argv
 
@@ -30,29 +31,37 @@ def get_workload_name(filepath: str):
     basename = os.path.basename(filepath)
     return os.path.splitext(basename)[0]
 
+# the folder functions below create their folder on the first call for each (project, policy)
+@functools.lru_cache(maxsize=None)
 def get_compiler_output_folder_path(project: str, policy: str) -> str:
     folder_path = f'benchmarks/bin/compiled/{project}/{policy}'
-    os.system(f'mkdir -p {folder_path}')
+    os.makedirs(folder_path, exist_ok=True)
     return folder_path
 
+@functools.lru_cache(maxsize=None)
 def get_compiler_stats_folder_path(project: str, policy: str) -> str:
     folder_path = f'out/{project}/compiler_results/{policy}'
-    os.system(f'mkdir -p {folder_path}')
+    os.makedirs(folder_path, exist_ok=True)
     return folder_path
 
+@functools.lru_cache(maxsize=None)
 def get_simulation_stats_folder_path(project: str, policy: str) -> str:
     folder_path = f'out/{project}/simulation_results/{policy}'
-    os.system(f'mkdir -p {folder_path}')
+    os.makedirs(folder_path, exist_ok=True)
     return folder_path
 
+# the stats file of a workload does not change while commands are generated, so read it once
+@functools.lru_cache(maxsize=None)
 def get_total_inst_count_for_workload(filepath: str):
     w = get_workload_name(filepath)
     stats_path = f'benchmarks/stats/{w}.txt'
-    with open(stats_path) as f:
-        for line in f:
-            key, _, value = line.partition(' ')
-            if key == 'UNROLLED_INSTRUCTION_COUNT':
-                return int(value.strip())
+    # read the whole (small) file at once and scan it as bytes -- `int` parses bytes directly
+    with open(stats_path, 'rb') as f:
+        data = f.read()
+    for line in data.splitlines():
+        key, _, value = line.partition(b' ')
+        if key == b'UNROLLED_INSTRUCTION_COUNT':
+            return int(value)
 
 ##############################################
 ##############################################
@@ -51,8 +51,8 @@ if pol == 'viszlai':
 else:
     mas_id = 1
 
-os.system(f'mkdir -p out/dms/compiled_results/{pol}')
-os.system(f'mkdir -p benchmarks/bin/compiled/{pol}')
+os.makedirs(f'out/dms/compiled_results/{pol}', exist_ok=True)
+os.makedirs(f'benchmarks/bin/compiled/{pol}', exist_ok=True)
 
 for (i,w) in enumerate(WORKLOADS):
     compiled_output_path = compiled_file_path(i, pol, cmp_count)
@@ -51,35 +51,52 @@ def stats_file_path(workload: int, policy: str, cmp_count: int) -> str:
 ##############################################
 ##############################################
 
-policy = argv[1]
-cmp_count = int(argv[2])
+def generate_commands(policy: str,
+                      cmp_count: int,
+                      mem_slowdown: int,
+                      compiler_policy: str,
+                      epr_buffer_capacity: int,
+                      epr_generation_rate: float,
+                      other_flags='') -> list[str]:
+    os.makedirs(f'out/dms/simulation_results/{policy}', exist_ok=True)
 
-mem_slowdown = int(argv[3])
-compiler_policy = argv[4]
+    mem_bb_round_ns = MEM_BB_ROUND_NS * mem_slowdown
+
+    # the simulator configuration is the same for every workload -- only the trace and stats file change
+    sim_args = f'{SIM_INST_COUNT} {TOTAL_INST_COUNT} -p {PRINT_PROGRESS}'\
+                + f' --cmp-sc-count {cmp_count}'\
+                + f' --fact-phys-qubits-per-program-qubit {FACT_PHYS_QUBITS_PER_PROGRAM_QUBIT}'\
+                + f' --mem-bb-num-modules {MEM_BB_NUM_MODULES}'\
+                + f' --mem-bb-round-ns {mem_bb_round_ns}'\
+                + f' --mem-is-remote'\
+                + f' --mem-epr-buffer-capacity {epr_buffer_capacity}'\
+                + f' --mem-epr-generation-frequency {epr_generation_rate} {other_flags}'
+
+    cmds = []
+    for (i,w) in enumerate(WORKLOADS):
+        trace_path = trace_file_path(i, compiler_policy, cmp_count)
+        stats_output_path = stats_file_path(i, policy, cmp_count)
+        cmds.append(f'./build/qs_sim_mem {trace_path} {sim_args} &> {stats_output_path}')
+    return cmds
+
+##############################################
+##############################################
 
-# other knobs:
-epr_buffer_capacity = int(argv[5])
-epr_generation_rate = float(argv[6])
-other_flags = ' '.join(argv[7:])
+if __name__ == '__main__':
+    policy = argv[1]
+    cmp_count = int(argv[2])
 
-os.system(f'mkdir -p out/dms/simulation_results/{policy}')
+    mem_slowdown = int(argv[3])
+    compiler_policy = argv[4]
 
-for (i,w) in enumerate(WORKLOADS):
-    trace_path = trace_file_path(i, compiler_policy, cmp_count)
-    stats_output_path = stats_file_path(i, policy, cmp_count)
+    # other knobs:
+    epr_buffer_capacity = int(argv[5])
+    epr_generation_rate = float(argv[6])
+    other_flags = ' '.join(argv[7:])
 
-    mem_bb_round_ns = MEM_BB_ROUND_NS * mem_slowdown
-    mem_epr_generation_frequency_khz = get_epr_generation_frequency(mem_bb_round_ns)
-
-    cmd = f'./build/qs_sim_mem {trace_path} {SIM_INST_COUNT} {TOTAL_INST_COUNT} -p {PRINT_PROGRESS}'\
-            + f' --cmp-sc-count {cmp_count}'\
-            + f' --fact-phys-qubits-per-program-qubit {FACT_PHYS_QUBITS_PER_PROGRAM_QUBIT}'\
-            + f' --mem-bb-num-modules {MEM_BB_NUM_MODULES}'\
-            + f' --mem-bb-round-ns {mem_bb_round_ns}'\
-            + f' --mem-is-remote'\
-            + f' --mem-epr-buffer-capacity {epr_buffer_capacity}'\
-            + f' --mem-epr-generation-frequency {epr_generation_rate} {other_flags} &> {stats_output_path}'
-    print(cmd)
+    for cmd in generate_commands(policy, cmp_count, mem_slowdown, compiler_policy,
+                                 epr_buffer_capacity, epr_generation_rate, other_flags):
+        print(cmd)
 
 ##############################################
 ##############################################
@@ -55,26 +55,26 @@ def stats_file_path(workload: int, policy: str, reduction: int) -> str:
 
 
 def print_commands(policy: str, reduce_where: int, fact_phys_qubits_per_program_qubit: int, reduction: float, regime: int):
-    os.system(f'mkdir -p out/qoc/simulation_results/{policy}')
+    os.makedirs(f'out/qoc/simulation_results/{policy}', exist_ok=True)
 
-    for (i,w) in enumerate(WORKLOADS):
-        trace_path = trace_file_path(i)
-        stats_output_path = stats_file_path(i, policy, int(reduction*100))
-
-        error_rate_regime = '1e-8' if regime <= 1 else '1e-12' 
-        cult_flag = '-cult' if (regime == 0 or regime == 2) else ''
+    error_rate_regime = '1e-8' if regime <= 1 else '1e-12' 
+    cult_flag = '-cult' if (regime == 0 or regime == 2) else ''
 
-        cmd = f'./build/qs_sim_mem {trace_path} {SIM_INST_COUNT} {TOTAL_INST_COUNT} -p {PRINT_PROGRESS}'\
+    # the simulator configuration is the same for every workload -- only the trace and stats file change
+    sim_args = f'{SIM_INST_COUNT} {TOTAL_INST_COUNT} -p {PRINT_PROGRESS}'\
                 + f' --cmp-sc-count {CMP_SC_COUNT}'\
                 + f' --fact-phys-qubits-per-program-qubit {fact_phys_qubits_per_program_qubit}'\
                 + f' --mem-bb-num-modules {MEM_BB_NUM_MODULES}'\
                 + f' --mem-bb-round-ns {MEM_BB_ROUND_NS}'
-        if reduction > 0 and reduce_where > 0:
-            cmd += f' -qoc {reduce_where} --qoc-reduction-fraction {reduction} -e {error_rate_regime} {cult_flag} &> {stats_output_path}'
-        else:
-            cmd += f' -e {error_rate_regime} {cult_flag} &> {stats_output_path}'
-                
-        print(cmd)
+    if reduction > 0 and reduce_where > 0:
+        sim_args += f' -qoc {reduce_where} --qoc-reduction-fraction {reduction} -e {error_rate_regime} {cult_flag}'
+    else:
+        sim_args += f' -e {error_rate_regime} {cult_flag}'
+
+    for (i,w) in enumerate(WORKLOADS):
+        trace_path = trace_file_path(i)
+        stats_output_path = stats_file_path(i, policy, int(reduction*100))
+        print(f'./build/qs_sim_mem {trace_path} {sim_args} &> {stats_output_path}')
 
 ##############################################
 ##############################################
@@ -50,7 +50,7 @@ D_T_TELEPORT_LIMIT = 0
 D_RPC_CAPACITY = 2
 
 def get_stats_file_path(workload_idx: int, policy: str, postfix=None) -> str:
-    os.system(f'mkdir -p out/rpc/simulation_results/{policy}')
+    os.makedirs(f'out/rpc/simulation_results/{policy}', exist_ok=True)
 
     name_base = COMPILE_TO[workload_idx]
     stats_file = f'out/rpc/simulation_results/{policy}/{name_base}'
@@ -0,0 +1,76 @@
+# author: Suhas Vittal
+
+'''
+    Local counterpart to `run_command_list_on_pace.py`: runs every command in a command
+    list (one `<cmd> &> <stats file>` or `<cmd> > <stats file>` per line) on this machine,
+    several at a time. The simulations are independent, so they only contend for cores.
+'''
+
+import argparse
+import os
+import shlex
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+##############################################
+##############################################
+
+# redirections we understand, and whether each also sends stderr to the file
+REDIRECTIONS = {'&>': True, '>': False}
+
+def parse_command(line: str):
+    # returns (argv, output path, whether stderr goes to the output), or None if `line` is not
+    # a single command ending in one of `REDIRECTIONS` and a file. The line is split into words
+    # first, so a quoted `>` (e.g., in `sh -c '... 1>&2'`) is part of the command
+    try:
+        words = shlex.split(line)
+    except ValueError:  # e.g., unbalanced quotes
+        return None
+    if len(words) < 3 or words[-2] not in REDIRECTIONS:
+        return None
+    return words[:-2], words[-1], REDIRECTIONS[words[-2]]
+
+def run_command(parsed) -> int:
+    (argv, output_path, merge_stderr) = parsed
+    # run without a shell -- the redirection becomes the child's stdout (and stderr for `&>`;
+    # with `>`, stderr goes to our terminal as it would from the shell)
+    try:
+        with open(output_path, 'w') as out:
+            stderr = subprocess.STDOUT if merge_stderr else None
+            return subprocess.run(argv, stdout=out, stderr=stderr).returncode
+    except OSError as e:  # missing output directory or executable -- count as failed, keep running the rest
+        print(f'error: {e}')
+        return -1
+
+##############################################
+##############################################
+
+parser = argparse.ArgumentParser(description='Run a command list (e.g. commands.out) on this machine.')
+parser.add_argument('command_file', nargs='?', default='commands.out')
+parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='number of commands to run at once')
+parser.add_argument('--singlecore', action='store_true', help='run the commands one after another (for debugging)')
+args = parser.parse_args()
+
+commands, skipped = [], []
+with open(args.command_file) as rd:
+    for line in rd:
+        if not line.strip():
+            continue
+        parsed = parse_command(line)
+        if parsed is None:
+            skipped.append(line.strip())
+        else:
+            commands.append(parsed)
+
+for line in skipped:
+    print(f'skipped (expected `<cmd> &> <file>` or `<cmd> > <file>`): {line}')
+
+num_jobs = 1 if args.singlecore else max(args.jobs, 1)
+# each job just waits on its subprocess, so threads are enough to run them in parallel
+with ThreadPoolExecutor(max_workers=num_jobs) as executor:
+    return_codes = list(executor.map(run_command, commands))
+
+failed = [shlex.join(argv) for ((argv, _, _), rc) in zip(commands, return_codes) if rc != 0]
+for cmd in failed:
+    print(f'failed: {cmd}')
+print(f'jobs = {len(commands)}, failed = {len(failed)}, skipped = {len(skipped)}')
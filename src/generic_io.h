@@ -22,7 +22,7 @@
 class LZMA_FILE
 {
 private:
-    constexpr static size_t LZMA_BUF_SIZE{4096};
+    constexpr static size_t LZMA_BUF_SIZE{64*1024};
 
     lzma_stream  lzma_strm;
     FILE*        file_istrm;